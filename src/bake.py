@@ -0,0 +1,98 @@
+"""
+Pré-geração do cache de assets em disco (sprites e sons procedurais)
+
+Uso:
+    python -m src.bake            # gera o que ainda não está no cache
+    python -m src.bake --clear    # apaga o cache e gera tudo de novo
+"""
+import argparse
+import os
+import sys
+import time
+
+# Drivers "dummy" antes de qualquer import do pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from .core.config import asset_cache_dir, load_config
+from .core.constants import SHIP_ALPHA_STEP, SOUND_SAMPLE_RATE
+from .entities.bullet import Bullet
+from .entities.player import Player
+from .entities.powerup import PowerUp
+from .entities.ship_types import ShipConfig, ShipType
+from .systems.asset_cache import ASSET_CACHE
+from .systems.sound_manager import SoundManager
+
+# Faixa de alpha da nave Stealth durante a invisibilidade (100 ± 50)
+STEALTH_ALPHA_RANGE = (50, 150)
+
+
+def bake_ships():
+    """Naves opacas de todos os tipos e as variantes translúcidas da Stealth"""
+    for ship_type in ShipConfig.SHIPS:
+        player = Player(0, 0, ship_type)
+        player.ship_sprite()
+        if ship_type == ShipType.STEALTH:
+            low, high = STEALTH_ALPHA_RANGE
+            for alpha in range(low, high + 1, SHIP_ALPHA_STEP):
+                player.ship_sprite(alpha)
+
+
+def bake_glow():
+    """Brilhos dos projéteis, power-ups e escudos em todos os tamanhos do pulso"""
+    Bullet.prerender_sprites()
+    PowerUp.prerender_sprites()
+    Player.prerender_shields()
+
+
+def bake_sounds():
+    """Amostras dos efeitos sonoros sintéticos"""
+    pygame.mixer.init(frequency=SOUND_SAMPLE_RATE, size=-16, channels=2, buffer=512)
+    SoundManager()
+
+
+STAGES = {
+    "ships": bake_ships,
+    "glow": bake_glow,
+    "sounds": bake_sounds,
+}
+
+
+def main(argv=None):
+    """Gera os assets pedidos e imprime quantos vieram do disco"""
+    parser = argparse.ArgumentParser(prog="python -m src.bake",
+                                     description="Pré-gera o cache de assets do StellarClash")
+    parser.add_argument("stages", nargs="*", metavar="ETAPA",
+                        help=f"etapas a executar (padrão: todas): {', '.join(STAGES)}")
+    parser.add_argument("--clear", action="store_true", help="apaga o cache antes de gerar")
+    parser.add_argument("--dir", metavar="DIRETÓRIO", help="diretório do cache (padrão: [ASSETS] cache_dir do config.ini)")
+    args = parser.parse_args(argv)
+
+    names = args.stages or list(STAGES)
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        parser.error(f"etapa desconhecida: {', '.join(unknown)}")
+
+    # Mesmo diretório que o jogo usa, a menos que --dir o troque
+    ASSET_CACHE.configure(directory=args.dir or asset_cache_dir(load_config()))
+    if args.clear:
+        ASSET_CACHE.clear()
+
+    pygame.init()
+    for name in names:
+        hits, misses = ASSET_CACHE.hits, ASSET_CACHE.misses
+        start = time.perf_counter()
+        STAGES[name]()
+        elapsed = (time.perf_counter() - start) * 1000.0
+        print(f"{name:<10} {ASSET_CACHE.misses - misses:>4} gerados  "
+              f"{ASSET_CACHE.hits - hits:>4} já em cache  {elapsed:8.1f} ms")
+
+    print(f"Cache: {ASSET_CACHE.directory}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
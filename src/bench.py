@@ -0,0 +1,296 @@
+"""
+Benchmarks de cenários de estresse do engine (headless)
+
+Uso:
+    python -m src.bench                      # todos os cenários
+    python -m src.bench asteroids bullets    # cenários escolhidos
+    python -m src.bench --ticks 600 --json resultado.json
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+# Drivers "dummy" antes de qualquer import do pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from .core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, RENDERER_SOFTWARE, RENDERER_TEXTURE
+from .core.game_engine import GameEngine
+from .core.game_states import GameState
+from .entities.asteroid import Asteroid
+from .entities.bullet import BULLET_POOL
+from .entities.enemy import Enemy
+from .entities.powerup import PowerUp
+from .systems.random_service import RandomService
+
+
+class Scenario:
+    """Cenário de benchmark: prepara o engine e mantém a carga a cada tick"""
+
+    def __init__(self, name, description, state=GameState.PLAYING):
+        self.name = name
+        self.description = description
+        self.state = state
+
+    def setup(self, game):
+        """Prepara o engine antes da medição"""
+        pass
+
+    def maintain(self, game, tick):
+        """Mantém a carga do cenário antes de cada tick"""
+        pass
+
+
+class AsteroidField(Scenario):
+    """N asteroides espalhados pela tela, repostos conforme saem"""
+
+    def __init__(self, count=60):
+        super().__init__("asteroids", f"{count} asteroides em tela")
+        self.count = count
+
+    def maintain(self, game, tick):
+        rng = RandomService().gameplay
+        while len(game.asteroids) < self.count:
+            x = rng.uniform(0, SCREEN_WIDTH)
+            y = rng.uniform(0, SCREEN_HEIGHT * 0.6)
+            game.asteroids.append(Asteroid(x, y, rng.choice([1, 2, 3])))
+
+
+class BulletStorm(Scenario):
+    """M balas do jogador com rastro, repostas a partir da base da tela"""
+
+    def __init__(self, count=300):
+        super().__init__("bullets", f"{count} balas do jogador com rastro")
+        self.count = count
+
+    def maintain(self, game, tick):
+        rng = RandomService().gameplay
+        while len(game.bullets) < self.count:
+            x = rng.uniform(0, SCREEN_WIDTH)
+            game.bullets.append(BULLET_POOL.acquire(x, SCREEN_HEIGHT - 20, -math.pi / 2 + rng.uniform(-0.3, 0.3)))
+
+
+class ExplosionStorm(Scenario):
+    """K explosões simultâneas, recriadas ao terminar"""
+
+    def __init__(self, count=20):
+        super().__init__("explosions", f"{count} explosões simultâneas")
+        self.count = count
+
+    def maintain(self, game, tick):
+        rng = RandomService().gameplay
+        while len(game.explosions) < self.count:
+            x = rng.uniform(0, SCREEN_WIDTH)
+            y = rng.uniform(0, SCREEN_HEIGHT)
+            game.add_explosion(x, y, rng.choice([0.5, 1, 1.5]))
+
+
+class NeutronBomb(Scenario):
+    """Tela cheia de asteroides e inimigos detonada por uma bomba de nêutrons"""
+
+    def __init__(self, asteroids=40, enemies=15, interval=120):
+        super().__init__("neutron_bomb",
+                         f"bomba de nêutrons sobre {asteroids} asteroides e {enemies} inimigos "
+                         f"a cada {interval} ticks")
+        self.asteroids = asteroids
+        self.enemies = enemies
+        self.interval = interval
+
+    def maintain(self, game, tick):
+        if tick % self.interval != 0:
+            return
+        rng = RandomService().gameplay
+        for _ in range(self.asteroids - len(game.asteroids)):
+            x = rng.uniform(0, SCREEN_WIDTH)
+            y = rng.uniform(0, SCREEN_HEIGHT * 0.7)
+            game.asteroids.append(Asteroid(x, y, rng.choice([1, 2, 3])))
+        for _ in range(self.enemies - len(game.enemies)):
+            x = rng.uniform(50, SCREEN_WIDTH - 50)
+            y = rng.uniform(0, SCREEN_HEIGHT * 0.5)
+            game.enemies.append(Enemy(x, y, rng.choice(["basic", "advanced"])))
+        game.powerups.append(PowerUp(game.player.pos.x, game.player.pos.y, "neutron_bomb"))
+
+
+class StarryMenu(Scenario):
+    """Menu principal com o campo de estrelas completo"""
+
+    def __init__(self):
+        super().__init__("menu", "menu com campo de estrelas", state=GameState.MENU)
+
+    def setup(self, game):
+        game.change_state(GameState.MENU)
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    AsteroidField(),
+    BulletStorm(),
+    ExplosionStorm(),
+    NeutronBomb(),
+    StarryMenu(),
+)}
+
+
+def percentile(sorted_values, fraction):
+    """Percentil por interpolação linear de uma lista já ordenada"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def summarize(samples):
+    """Estatísticas em milissegundos de uma lista de tempos em segundos"""
+    ordered = sorted(samples)
+    return {
+        "mean": 1000.0 * sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50": 1000.0 * percentile(ordered, 0.50),
+        "p95": 1000.0 * percentile(ordered, 0.95),
+        "p99": 1000.0 * percentile(ordered, 0.99),
+        "max": 1000.0 * ordered[-1] if ordered else 0.0,
+    }
+
+
+def _prepare(scenario, seed, renderer=RENDERER_SOFTWARE):
+    """Cria um engine headless no estado inicial do cenário"""
+    # O backend de texturas usa o driver "software" do SDL (disponível sem GPU)
+    render_driver = "software" if renderer == RENDERER_TEXTURE else None
+    game = GameEngine(headless=True, seed=seed, renderer=renderer, render_driver=render_driver)
+    if scenario.state == GameState.PLAYING:
+        game.change_state(GameState.PLAYING)
+    scenario.setup(game)
+    return game
+
+
+def _tick(game, scenario, tick):
+    """Executa um tick do cenário mantendo o jogador vivo"""
+    scenario.maintain(game, tick)
+    game.player.health = game.player.max_health
+    game.step()
+
+
+def run_scenario(scenario, ticks=300, warmup=30, seed=1234, draw=True, renderer=RENDERER_SOFTWARE):
+    """Mede update e draw (com o envio à janela) por tick; retorna as estatísticas do cenário"""
+    game = _prepare(scenario, seed, renderer)
+
+    for tick in range(warmup):
+        _tick(game, scenario, tick)
+        if draw:
+            game.draw()
+            game.present()
+
+    update_times = []
+    draw_times = []
+    gc_before = gc.get_stats()[0]["collections"]
+    clock = time.perf_counter
+
+    for tick in range(warmup, warmup + ticks):
+        start = clock()
+        _tick(game, scenario, tick)
+        update_times.append(clock() - start)
+
+        if draw:
+            start = clock()
+            game.draw()
+            game.present()
+            draw_times.append(clock() - start)
+
+    result = {
+        "scenario": scenario.name,
+        "description": scenario.description,
+        "ticks": ticks,
+        "update_ms": summarize(update_times),
+        "draw_ms": summarize(draw_times) if draw else None,
+        "gc_gen0_collections": gc.get_stats()[0]["collections"] - gc_before,
+    }
+    return result
+
+
+def measure_allocations(scenario, ticks=300, warmup=30, seed=1234, draw=True, renderer=RENDERER_SOFTWARE):
+    """Repete o cenário com tracemalloc; retorna pico e memória líquida (KiB)"""
+    game = _prepare(scenario, seed, renderer)
+    for tick in range(warmup):
+        _tick(game, scenario, tick)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for tick in range(warmup, warmup + ticks):
+        _tick(game, scenario, tick)
+        if draw:
+            game.draw()
+            game.present()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "peak_kib": (peak - baseline) / 1024.0,
+        "net_kib": (current - baseline) / 1024.0,
+    }
+
+
+def format_result(result):
+    """Linhas de relatório legíveis para um cenário"""
+    lines = [f"== {result['scenario']}: {result['description']} ({result['ticks']} ticks)"]
+    for label in ("update_ms", "draw_ms"):
+        stats = result.get(label)
+        if stats:
+            lines.append(f"   {label[:-3]:<7} média {stats['mean']:7.3f}  p50 {stats['p50']:7.3f}  "
+                         f"p95 {stats['p95']:7.3f}  p99 {stats['p99']:7.3f}  máx {stats['max']:7.3f} ms")
+    lines.append(f"   gc gen0 {result['gc_gen0_collections']} coletas")
+    allocations = result.get("allocations")
+    if allocations:
+        lines.append(f"   memória pico {allocations['peak_kib']:.1f} KiB  líquida {allocations['net_kib']:.1f} KiB")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Executa os cenários pedidos e imprime/salva o relatório"""
+    parser = argparse.ArgumentParser(prog="python -m src.bench",
+                                     description="Benchmarks de estresse do StellarClash")
+    parser.add_argument("scenarios", nargs="*", metavar="CENÁRIO",
+                        help=f"cenários a executar (padrão: todos): {', '.join(SCENARIOS)}")
+    parser.add_argument("--ticks", type=int, default=300, help="ticks medidos por cenário")
+    parser.add_argument("--warmup", type=int, default=30, help="ticks de aquecimento")
+    parser.add_argument("--seed", type=int, default=1234, help="semente dos cenários")
+    parser.add_argument("--no-draw", action="store_true", help="mede apenas o update")
+    parser.add_argument("--no-alloc", action="store_true", help="pula a medição de memória")
+    parser.add_argument("--renderer", choices=(RENDERER_SOFTWARE, RENDERER_TEXTURE), default=RENDERER_SOFTWARE,
+                        help="backend de renderização medido")
+    parser.add_argument("--json", metavar="ARQUIVO", help="salva os resultados em JSON")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenário desconhecido: {', '.join(unknown)}")
+    draw = not args.no_draw
+    results = []
+
+    for name in names:
+        scenario = SCENARIOS[name]
+        result = run_scenario(scenario, args.ticks, args.warmup, args.seed, draw, args.renderer)
+        if not args.no_alloc:
+            result["allocations"] = measure_allocations(scenario, args.ticks, args.warmup, args.seed, draw,
+                                                        args.renderer)
+        results.append(result)
+        print(format_result(result))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+Leitura das configurações do config.ini
+"""
+import configparser
+import os
+
+# config.ini fica na raiz do projeto
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "config.ini")
+
+
+def load_config(path=CONFIG_PATH):
+    """Lê o arquivo de configuração; seções ou arquivo ausentes viram valores padrão"""
+    config = configparser.ConfigParser()
+    config.read(path, encoding="utf-8")
+    return config
+
+
+def asset_cache_dir(config):
+    """Diretório do cache de assets em [ASSETS] cache_dir, ou None para o padrão
+
+    Caminhos relativos partem da raiz do projeto (onde está o config.ini).
+    """
+    directory = config.get("ASSETS", "cache_dir", fallback="").strip()
+    if not directory:
+        return None
+    return os.path.join(os.path.dirname(CONFIG_PATH), directory)
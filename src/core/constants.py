@@ -5,7 +5,16 @@ Constantes do jogo StellarClash
 # Configurações da tela
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
-FPS = 60
+FPS = 60  # Taxa de renderização
+IDLE_FPS = 30  # Taxa nas telas paradas (menu, pausa, fim de jogo)
+
+# Backends de renderização
+RENDERER_SOFTWARE = "software"  # Surfaces do pygame (padrão)
+RENDERER_TEXTURE = "texture"  # Texturas do SDL_Renderer (pygame._sdl2)
+
+# Simulação em passo fixo
+TICK_RATE = 60  # Ticks de simulação por segundo
+MAX_CATCHUP_STEPS = 5  # Máximo de ticks por quadro ao recuperar atrasos
 
 # Cores
 BLACK = (0, 0, 0)
@@ -24,6 +33,51 @@ PLAYER_SPEED = 300
 PLAYER_SHOT_COOLDOWN = 0.15
 PLAYER_INVULNERABLE_DURATION = 2.0
 
+# Pools de objetos
+BULLET_POOL_CAPACITY = 512
+MAX_PARTICLES = 16384  # Limite do armazém de partículas (struct-of-arrays)
+
+# Cache de sprites de brilho
+GLOW_CACHE_MAX_ENTRIES = 512
+GLOW_ALPHA_STEP = 8  # Degrau de quantização do alpha pulsante
+GLOW_PULSE_SAMPLES = 128  # Pulsos amostrados ao pré-renderizar os brilhos
+SHIP_ALPHA_STEP = 10  # Degrau de alpha das variantes da nave Stealth
+ASTEROID_SHAPES_PER_SIZE = 6  # Formas distintas por tamanho de asteroide
+ASTEROID_ROTATION_STEPS = 36  # Ângulos pré-renderizados por forma (10 graus)
+
+# Campo de estrelas
+STARFIELD_STARS = 200
+STARFIELD_LAYER_SPEEDS = (30, 65, 100)  # Pixels por segundo, do fundo para a frente
+STARFIELD_TWINKLE_FRAMES = 6  # Quadros de cintilação pré-renderizados por camada
+STARFIELD_TWINKLE_PERIOD = 2.0  # Segundos por ciclo de cintilação
+
+# Renderização por retângulos sujos (opcional)
+DIRTY_RECT_MAX_FRACTION = 0.5  # Acima desta fração da tela, envia o quadro inteiro
+DIRTY_RECT_TILE = 64  # Lado dos blocos usados para agrupar partículas
+
+# Cache em disco dos assets gerados (incrementar ao mudar o código de geração)
+ASSET_CACHE_VERSION = 2
+
+# Áudio
+SOUND_SAMPLE_RATE = 22050  # Frequência do mixer e dos sons sintetizados
+SOUND_VARIANTS = 4  # Variantes pré-sintetizadas por efeito (sobrescrito por "variants" no efeito)
+SOUND_BANK_MAX_BYTES = 1024 * 1024  # Teto de memória das amostras de todas as variantes
+SOUND_PITCH_JITTER = 0.06  # Variação relativa máxima da altura entre variantes
+SOUND_VOLUME_JITTER = 0.15  # Variação relativa máxima do volume entre variantes
+SOUND_ENVELOPE_JITTER = 0.2  # Variação relativa máxima da duração e do decay entre variantes
+SOUND_CATEGORY_CHANNELS = {  # Canais do mixer reservados para cada categoria de efeito
+    "weapons": 2,
+    "explosions": 4,
+    "alerts": 2,
+}
+SOUND_FREE_CHANNELS = 4  # Canais além dos reservados, livres para Sound.play() direto
+SOUND_COALESCE_GAIN = 0.5  # Ganho extra a cada dobra de pedidos iguais no mesmo tick
+SOUND_COALESCE_MAX_GAIN = 2.0  # Teto do ganho de pedidos agrupados
+
+# HUD
+TEXT_CACHE_MAX_ENTRIES = 256  # Textos renderizados mantidos no cache (LRU)
+HUD_TIMER_STEP = 0.1  # Resolução, em segundos, dos timers exibidos
+
 # Configurações de spawn
 ASTEROID_SPAWN_RATE = 2.0
 ENEMY_SPAWN_RATE = 3.0
@@ -1,20 +1,32 @@
 """
 Engine principal do jogo usando Facade Pattern
 """
+import os
 import pygame
 import sys
-import random
+import time
+from contextlib import contextmanager
 from .constants import *
 from .game_states import *
 from ..entities.player import Player
-from ..entities.bullet import Bullet
+from ..entities.bullet import Bullet, BULLET_POOL
 from ..entities.asteroid import Asteroid
 from ..entities.enemy import Enemy
 from ..entities.powerup import PowerUp
-from ..entities.star import Star
 from ..effects.explosions import ExplosionEffect
+from ..effects.particles import ParticleSystem
+from ..effects.starfield import Starfield
 from ..systems.sound_manager import SoundManager
 from ..systems.screen_shake import ScreenShake
+from ..systems.spatial_hash import SpatialHash
+from ..systems.collision import first_hits
+from ..systems.input_state import KeyState, InputRecording, InputReplay
+from ..systems.random_service import RandomService
+from ..systems.profiler import FrameProfiler
+from ..systems.dirty_rects import DirtyRectRenderer
+from ..systems.render_queue import (RenderQueue, LAYER_BACKGROUND, LAYER_EFFECTS, LAYER_BULLETS,
+                                    LAYER_ASTEROIDS, LAYER_ACTORS, LAYER_PLAYER, LAYER_HUD)
+from ..systems.texture_renderer import TextureRenderer, TextureRenderQueue
 from ..ui.hud import HUD
 from ..utils.vector2 import Vector2
 
@@ -22,26 +34,89 @@ from ..utils.vector2 import Vector2
 class GameEngine:
     """Engine principal do jogo (Facade Pattern)"""
     
-    def __init__(self):
+    def __init__(self, fps=FPS, tick_rate=TICK_RATE, max_catchup_steps=MAX_CATCHUP_STEPS,
+                 headless=False, seed=None, record_path=None, replay=None, profile=False,
+                 dirty_rects=False, renderer=RENDERER_SOFTWARE, render_driver=None, window_size=None):
+        # Modo headless: drivers "dummy" do SDL, sem janela nem dispositivo de áudio
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        
         # Inicialização do Pygame
         pygame.init()
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(frequency=SOUND_SAMPLE_RATE, size=-16, channels=2, buffer=512)
         
         # Configurações da tela
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # renderer: RENDERER_SOFTWARE (Surfaces) ou RENDERER_TEXTURE (SDL_Renderer);
+        # render_driver: driver do SDL para o backend de texturas (None = automático)
+        # window_size: tamanho da janela no backend de texturas (None = resolução
+        # lógica); o jogo continua em SCREEN_WIDTH x SCREEN_HEIGHT e o renderer
+        # amplia o quadro pronto uma única vez, na apresentação
+        if renderer == RENDERER_TEXTURE:
+            # A janela é do renderer; a do módulo display fica oculta e só
+            # define o formato de pixels usado por convert()
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            self.texture_renderer = TextureRenderer((SCREEN_WIDTH, SCREEN_HEIGHT), "StellarClash", render_driver,
+                                                    window_size)
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        elif renderer == RENDERER_SOFTWARE:
+            if window_size is not None and tuple(window_size) != (SCREEN_WIDTH, SCREEN_HEIGHT):
+                raise ValueError(f"O backend software não amplia a janela: use {RENDERER_TEXTURE} "
+                                 f"para {window_size[0]}x{window_size[1]}")
+            self.texture_renderer = None
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            raise ValueError(f"Renderer desconhecido: {renderer}")
         pygame.display.set_caption("StellarClash")
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Loop em passo fixo: a simulação roda a tick_rate, a renderização a fps
+        if replay is not None:
+            tick_rate = replay.tick_rate
+        self.fps = fps
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate
+        self.max_catchup_steps = max_catchup_steps
+        self.render_alpha = 1.0  # Fração do tick atual usada na interpolação
+        
+        # Entrada injetada (KeyState) no lugar do teclado real, usada por step()
+        self.input_keys = None
+        # Simulações headless não sobrescrevem o recorde salvo
+        self.persist_high_score = not headless
+        
+        # Aleatoriedade semeada e gravação/replay de entradas
+        # seed: semente base; cada partida usa seed + número de partidas encerradas
+        # replay: InputRecording a reproduzir (define semente e taxa de ticks)
+        self.rng = RandomService()
+        self.replay = InputReplay(replay) if replay is not None else None
+        self.base_seed = seed
+        self.session_index = 0
+        self.session_seed = None
+        self.record_path = record_path
+        self.recording = None
+        self.pending_shot = False
+        
         # Sistemas
+        self.profiler = FrameProfiler(enabled=profile)
         self.sound_manager = SoundManager()
         self.screen_shake = ScreenShake()
+        self.collision_grid = SpatialHash()
+        # Armazém único das partículas de explosões, rastros e brilhos
+        self.particles = ParticleSystem()
         
         # Fontes
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 32)
         
+        # Sprites das naves e brilhos renderizados uma única vez (fora do loop de quadros)
+        Player.prerender_ships()
+        Player.prerender_shields()
+        Bullet.prerender_sprites()
+        PowerUp.prerender_sprites()
+        
         # UI
         self.hud = HUD(self.font_large, self.font_medium, self.font_small)
         
@@ -55,13 +130,52 @@ class GameEngine:
         }
         
         # Estrelas do fundo
-        self.stars = [Star() for _ in range(200)]
+        self.starfield = Starfield()
+        
+        # Back buffer da cena, criado uma vez no formato da tela; a tremida é
+        # aplicada como deslocamento no blit para a tela
+        self.back_buffer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        
+        # Fila de blits das entidades com sprite (recorte fora da tela e lotes por camada),
+        # usada por todo desenho que tem uma superfície como destino
+        self.render_queue = RenderQueue(self.back_buffer.get_rect())
+        # Fila de texturas, só para a cena composta no renderer
+        if self.texture_renderer is not None:
+            self.texture_queue = TextureRenderQueue(self.texture_renderer, self.back_buffer.get_rect())
+        else:
+            self.texture_queue = None
+        # Quadro atual composto com texturas (durante o jogo no backend de texturas)
+        self.frame_textured = False
+        
+        # Renderização por retângulos sujos (opcional): durante o jogo o fundo
+        # fica estático e só as regiões alteradas são enviadas à tela.
+        # Não se aplica ao backend de texturas, que recompõe o quadro inteiro
+        use_dirty_rects = dirty_rects and self.texture_renderer is None
+        self.dirty_renderer = DirtyRectRenderer(self.screen, DIRTY_RECT_MAX_FRACTION) if use_dirty_rects else None
+        self.frame_rects = None
         
         # Inicializar jogo
         self.reset_game()
     
     def reset_game(self):
         """Reinicia o jogo"""
+        # Semente da partida: a do replay, ou determinística quando há semente base
+        if self.replay is not None:
+            self.session_seed = self.rng.reseed(self.replay.recording.seed)
+        elif self.base_seed is not None:
+            self.session_seed = self.rng.reseed(self.base_seed + self.session_index)
+        else:
+            self.session_seed = self.rng.reseed()
+        
+        if self.record_path is not None:
+            self.recording = InputRecording(self.session_seed, self.tick_rate)
+        self.pending_shot = False
+        
+        # Devolver projéteis da partida anterior ao pool
+        if hasattr(self, "bullets"):
+            BULLET_POOL.release_all(self.bullets)
+            BULLET_POOL.release_all(self.enemy_bullets)
+        
         self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
         self.bullets = []
         self.enemy_bullets = []
@@ -69,6 +183,7 @@ class GameEngine:
         self.enemies = []
         self.powerups = []
         self.explosions = []
+        self.particles.clear()
         
         self.score = 0
         self.high_score = self.load_high_score()
@@ -90,13 +205,24 @@ class GameEngine:
         if new_state == GameState.PLAYING:
             if self.current_state != GameState.PAUSED:
                 self.reset_game()
+            if self.dirty_renderer is not None:
+                self._refresh_static_background()
         elif new_state == GameState.GAME_OVER:
+            self.save_recording()
+            self.session_index += 1
             if self.score > self.high_score:
                 self.high_score = self.score
                 self.save_high_score()
             self.states[GameState.GAME_OVER].timer = 0
         
+        previous_state = self.current_state
         self.current_state = new_state
+        
+        # Pausa: congela o último quadro uma vez; ao sair, libera a cópia
+        if new_state == GameState.PAUSED:
+            self.states[GameState.PAUSED].freeze(self)
+        elif previous_state == GameState.PAUSED:
+            self.states[GameState.PAUSED].frozen_frame = None
     
     def load_high_score(self):
         """Carrega a pontuação máxima"""
@@ -108,12 +234,19 @@ class GameEngine:
     
     def save_high_score(self):
         """Salva a pontuação máxima"""
+        if not self.persist_high_score:
+            return
         try:
             with open("high_score.txt", "w") as f:
                 f.write(str(self.high_score))
         except:
             pass
     
+    def save_recording(self):
+        """Salva a gravação de entradas da partida atual, se habilitada"""
+        if self.recording is not None and self.record_path is not None:
+            self.recording.save(self.record_path)
+    
     def handle_events(self):
         """Processa eventos"""
         events = pygame.event.get()
@@ -121,6 +254,11 @@ class GameEngine:
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.WINDOWCLOSE and self.texture_renderer is not None:
+                # A janela oculta do módulo display impede o SDL de gerar QUIT
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
         
         # Delegar eventos para o estado atual
         self.states[self.current_state].handle_events(self, events)
@@ -132,86 +270,184 @@ class GameEngine:
         
         # Delegar atualização para o estado atual
         self.states[self.current_state].update(self, dt)
+        
+        # Tocar os sons pedidos neste tick (pedidos repetidos viram uma voz só)
+        self.sound_manager.flush()
+    
+    def queue_shot(self):
+        """Agenda um disparo para o próximo tick (mantém o replay determinístico)"""
+        self.pending_shot = True
+    
+    def _read_tick_input(self):
+        """Lê a entrada do tick (replay, injetada ou teclado) e a grava se habilitado"""
+        if self.replay is not None:
+            keys_pressed, shoot = self.replay.next_tick()
+        elif self.input_keys is not None:
+            keys_pressed, shoot = self.input_keys, self.pending_shot
+        else:
+            keys_pressed, shoot = pygame.key.get_pressed(), self.pending_shot
+        self.pending_shot = False
+        
+        if self.recording is not None:
+            self.recording.record(keys_pressed, shoot)
+        return keys_pressed, shoot
+    
+    def fire_player_weapon(self):
+        """Dispara a arma do jogador, respeitando o cooldown"""
+        bullets = self.player.shoot()
+        self.bullets.extend(bullets)
+        if bullets:
+            self.sound_manager.play_sound('laser')
+        return bullets
     
     def update_game_logic(self, dt):
         """Atualiza a lógica do jogo (chamado pelo PlayingState)"""
-        keys_pressed = pygame.key.get_pressed()
+        keys_pressed, shoot = self._read_tick_input()
         
-        # Atualizar jogador
-        self.player.update(dt, keys_pressed)
+        # Guardar posições do início do tick para a interpolação
+        for entity in self._moving_entities():
+            entity.save_previous_position()
         
-        # Atualizar projéteis
-        self.bullets = [b for b in self.bullets if b.alive]
-        self.enemy_bullets = [b for b in self.enemy_bullets if b.alive]
+        if shoot:
+            self.fire_player_weapon()
+        
+        profiler = self.profiler
         
-        for bullet in self.bullets:
-            bullet.update(dt)
-        for bullet in self.enemy_bullets:
-            bullet.update(dt)
+        # Atualizar jogador
+        with profiler.section("update.player"):
+            self.player.update(dt, keys_pressed)
         
-        # Atualizar e processar colisões
-        self._update_asteroids(dt)
-        self._update_enemies(dt)
-        self._update_powerups(dt)
-        self._check_player_collisions()
+        # Atualizar projéteis
+        with profiler.section("update.bullets"):
+            self.bullets = self._collect_dead_bullets(self.bullets)
+            self.enemy_bullets = self._collect_dead_bullets(self.enemy_bullets)
+            
+            particles = self.particles
+            for bullet in self.bullets:
+                bullet.update(dt, particles)
+            for bullet in self.enemy_bullets:
+                bullet.update(dt, particles)
+        
+        # Atualizar entidades
+        with profiler.section("update.asteroids"):
+            self._update_asteroids(dt)
+        with profiler.section("update.enemies"):
+            self._update_enemies(dt)
+        with profiler.section("update.powerups"):
+            self._update_powerups(dt)
+        
+        with profiler.section("update.collisions"):
+            # Colisões das balas do jogador (kernel vetorizado)
+            self._check_asteroid_collisions()
+            self._check_enemy_collisions()
+            
+            # Broadphase: grade reconstruída uma vez por tick para as colisões do jogador
+            self._rebuild_collision_grid()
+            self._check_powerup_collisions()
+            self._check_player_collisions()
         
         # Atualizar explosões
-        self.explosions = [e for e in self.explosions if not e.update(dt)]
+        with profiler.section("update.explosions"):
+            self.explosions = [e for e in self.explosions if not e.update(dt)]
+            self.particles.update(dt)
         
-        # Atualizar estrelas
-        for star in self.stars:
-            star.update(dt)
+        # Atualizar estrelas (congeladas no modo de retângulos sujos)
+        with profiler.section("update.stars"):
+            if self.dirty_renderer is None:
+                self.starfield.update(dt)
         
         # Spawning
-        self._handle_spawning(dt)
+        with profiler.section("update.spawning"):
+            self._handle_spawning(dt)
+            
+            # Aumentar dificuldade
+            self._handle_wave_progression(dt)
         
-        # Aumentar dificuldade
-        self._handle_wave_progression(dt)
+        if profiler.enabled:
+            profiler.set_counts(self._entity_counts())
+    
+    def _entity_counts(self):
+        """Contagem de entidades exibida pelo profiler"""
+        return {
+            "balas": len(self.bullets),
+            "balas inimigas": len(self.enemy_bullets),
+            "asteroides": len(self.asteroids),
+            "inimigos": len(self.enemies),
+            "power-ups": len(self.powerups),
+            "explosões": len(self.explosions),
+            "partículas": len(self.particles) + len(self.player.particle_system),
+        }
+    
+    def _collect_dead_bullets(self, bullets):
+        """Retorna os projéteis vivos e devolve os mortos ao pool"""
+        alive = []
+        for bullet in bullets:
+            if bullet.alive:
+                alive.append(bullet)
+            else:
+                BULLET_POOL.release(bullet)
+        return alive
+    
+    def _moving_entities(self):
+        """Retorna as entidades que se movem e são interpoladas na renderização"""
+        return ([self.player] + self.bullets + self.enemy_bullets +
+                self.asteroids + self.enemies + self.powerups)
+    
+    def _rebuild_collision_grid(self):
+        """Reconstrói a grade espacial com as entidades do tick atual"""
+        self.collision_grid.rebuild([
+            ("asteroid", self.asteroids),
+            ("enemy", self.enemies),
+            ("enemy_bullet", self.enemy_bullets),
+            ("powerup", self.powerups),
+        ])
     
     def _update_asteroids(self, dt):
-        """Atualiza asteroides e suas colisões"""
-        new_asteroids = []
-        
+        """Atualiza asteroides"""
         for asteroid in self.asteroids[:]:
             if not asteroid.alive or asteroid.is_off_screen():
-                if asteroid in self.asteroids:
-                    self.asteroids.remove(asteroid)
+                self.asteroids.remove(asteroid)
                 continue
             
             asteroid.update(dt)
+    
+    def _check_asteroid_collisions(self):
+        """Verifica colisões dos asteroides com as balas do jogador"""
+        new_asteroids = []
+        asteroids = self.asteroids[:]
+        hits = first_hits(self.bullets, asteroids)
+        
+        for asteroid, bullet_index in zip(asteroids, hits):
+            if bullet_index < 0:
+                continue
             
-            # Verificar colisão com balas do jogador
-            for bullet in self.bullets[:]:
-                if bullet.owner == "player" and asteroid.check_collision(bullet):
-                    self.bullets.remove(bullet)
-                    bullet.alive = False
-                    
-                    children = asteroid.take_damage()
-                    if not asteroid.alive:
-                        self.asteroids.remove(asteroid)
-                        self.score += asteroid.size * 10
-                        self.sound_manager.play_sound('explosion')
-                        self.explosions.append(ExplosionEffect(asteroid.pos.x, asteroid.pos.y, asteroid.size * 0.5))
-                        self.screen_shake.add_shake(asteroid.size * 2, 0.2)
-                        
-                        # Chance de dropar power-up
-                        if random.random() < POWERUP_DROP_CHANCE_ASTEROID:
-                            powerup_type = random.choice(["triple_shot", "shield", "neutron_bomb"])
-                            self.powerups.append(PowerUp(asteroid.pos.x, asteroid.pos.y, powerup_type))
-                        
-                        # Adicionar asteroides filhos se houver
-                        if children:
-                            new_asteroids.extend(children)
-                    break
+            self.bullets[bullet_index].alive = False
+            
+            children = asteroid.take_damage()
+            if not asteroid.alive:
+                self.asteroids.remove(asteroid)
+                self.score += asteroid.size * 10
+                self.sound_manager.play_sound('explosion')
+                self.add_explosion(asteroid.pos.x, asteroid.pos.y, asteroid.size * 0.5)
+                self.screen_shake.add_shake(asteroid.size * 2, 0.2)
+                
+                # Chance de dropar power-up
+                if self.rng.gameplay.random() < POWERUP_DROP_CHANCE_ASTEROID:
+                    powerup_type = self.rng.gameplay.choice(["triple_shot", "shield", "neutron_bomb"])
+                    self.powerups.append(PowerUp(asteroid.pos.x, asteroid.pos.y, powerup_type))
+                
+                # Adicionar asteroides filhos se houver
+                if children:
+                    new_asteroids.extend(children)
         
+        self.bullets = self._collect_dead_bullets(self.bullets)
         self.asteroids.extend(new_asteroids)
     
     def _update_enemies(self, dt):
-        """Atualiza inimigos e suas colisões"""
+        """Atualiza inimigos e seus disparos"""
         for enemy in self.enemies[:]:
             if not enemy.alive or enemy.is_off_screen():
-                if enemy in self.enemies:
-                    self.enemies.remove(enemy)
+                self.enemies.remove(enemy)
                 continue
             
             enemy.update(dt, self.player.pos)
@@ -219,55 +455,74 @@ class GameEngine:
             # Inimigo atira
             enemy_bullets = enemy.shoot(self.player.pos)
             self.enemy_bullets.extend(enemy_bullets)
+    
+    def _check_enemy_collisions(self):
+        """Verifica colisões dos inimigos com as balas do jogador"""
+        enemies = self.enemies[:]
+        hits = first_hits(self.bullets, enemies)
+        
+        for enemy, bullet_index in zip(enemies, hits):
+            if bullet_index < 0:
+                continue
             
-            # Verificar colisão com balas do jogador
-            for bullet in self.bullets[:]:
-                if bullet.owner == "player" and enemy.check_collision(bullet):
-                    self.bullets.remove(bullet)
-                    bullet.alive = False
-                    
-                    if enemy.take_damage():
-                        self.enemies.remove(enemy)
-                        self.score += 50
-                        self.sound_manager.play_sound('explosion')
-                        self.explosions.append(ExplosionEffect(enemy.pos.x, enemy.pos.y))
-                        self.screen_shake.add_shake(3, 0.15)
-                        
-                        # Chance de dropar power-up
-                        if random.random() < POWERUP_DROP_CHANCE_ENEMY:
-                            powerup_type = random.choice(["triple_shot", "shield", "neutron_bomb"])
-                            self.powerups.append(PowerUp(enemy.pos.x, enemy.pos.y, powerup_type))
-                    break
+            self.bullets[bullet_index].alive = False
+            
+            if enemy.take_damage():
+                self.enemies.remove(enemy)
+                self.score += 50
+                self.sound_manager.play_sound('explosion')
+                self.add_explosion(enemy.pos.x, enemy.pos.y)
+                self.screen_shake.add_shake(3, 0.15)
+                
+                # Chance de dropar power-up
+                if self.rng.gameplay.random() < POWERUP_DROP_CHANCE_ENEMY:
+                    powerup_type = self.rng.gameplay.choice(["triple_shot", "shield", "neutron_bomb"])
+                    self.powerups.append(PowerUp(enemy.pos.x, enemy.pos.y, powerup_type))
+        
+        self.bullets = self._collect_dead_bullets(self.bullets)
+    
+    def add_explosion(self, x, y, size=1, explosion_type="normal"):
+        """Cria uma explosão cujas partículas vão para o armazém compartilhado"""
+        explosion = ExplosionEffect(x, y, size, explosion_type, self.particles)
+        self.explosions.append(explosion)
+        return explosion
     
     def _update_powerups(self, dt):
-        """Atualiza power-ups e suas colisões"""
+        """Atualiza power-ups"""
         for powerup in self.powerups[:]:
             if not powerup.alive or powerup.is_off_screen():
-                if powerup in self.powerups:
-                    self.powerups.remove(powerup)
+                self.powerups.remove(powerup)
                 continue
             
-            powerup.update(dt)
-            
+            powerup.update(dt, self.particles)
+    
+    def _check_powerup_collisions(self):
+        """Verifica a coleta de power-ups pelo jogador"""
+        for powerup in self.collision_grid.query_entity(self.player, "powerup"):
             # Verificar colisão com jogador
             if powerup.check_collision(self.player):
                 self.powerups.remove(powerup)
+                powerup.alive = False
                 
                 if powerup.type == "neutron_bomb":
                     # Bomba de nêutrons - destrói tudo
                     for asteroid in self.asteroids:
                         self.score += asteroid.size * 10
-                        self.explosions.append(ExplosionEffect(asteroid.pos.x, asteroid.pos.y, asteroid.size * 0.5))
+                        self.add_explosion(asteroid.pos.x, asteroid.pos.y, asteroid.size * 0.5)
                     for enemy in self.enemies:
                         self.score += 50
-                        self.explosions.append(ExplosionEffect(enemy.pos.x, enemy.pos.y))
+                        self.add_explosion(enemy.pos.x, enemy.pos.y)
+                    
+                    # Entidades mortas são ignoradas pelas consultas restantes da grade
+                    for entity in self.asteroids + self.enemies + self.enemy_bullets:
+                        entity.alive = False
                     
                     self.asteroids.clear()
                     self.enemies.clear()
-                    self.enemy_bullets.clear()
+                    self.enemy_bullets = self._collect_dead_bullets(self.enemy_bullets)
                     
                     # Grande explosão
-                    self.explosions.append(ExplosionEffect(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 3, "big"))
+                    self.add_explosion(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 3, "big")
                     self.screen_shake.add_shake(15, 0.8)
                 else:
                     self.player.collect_powerup(powerup.type)
@@ -276,35 +531,44 @@ class GameEngine:
     
     def _check_player_collisions(self):
         """Verifica colisões do jogador"""
+        grid = self.collision_grid
+        
         # Colisão com asteroides
-        for asteroid in self.asteroids:
+        for asteroid in grid.query_entity(self.player, "asteroid"):
             if self.player.check_collision(asteroid):
                 if self.player.take_damage():
                     self.sound_manager.play_sound('hit')
                     self.screen_shake.add_shake(5, 0.3)
                 if not self.player.alive:
+                    # Uma única transição por tick: encerra a partida e para aqui
                     self.change_state(GameState.GAME_OVER)
+                    return
                 break
         
         # Colisão com inimigos
-        for enemy in self.enemies:
+        for enemy in grid.query_entity(self.player, "enemy"):
             if self.player.check_collision(enemy):
                 if self.player.take_damage():
                     self.sound_manager.play_sound('hit')
                     self.screen_shake.add_shake(5, 0.3)
                 if not self.player.alive:
                     self.change_state(GameState.GAME_OVER)
+                    return
                 break
         
         # Colisão com balas inimigas
-        for bullet in self.enemy_bullets[:]:
-            if self.player.check_collision(bullet):
+        for bullet in grid.query_entity(self.player, "enemy_bullet"):
+            if bullet.check_collision(self.player):
                 self.enemy_bullets.remove(bullet)
+                bullet.alive = False
+                grid.remove(bullet)
+                BULLET_POOL.release(bullet)
                 if self.player.take_damage():
                     self.sound_manager.play_sound('hit')
                     self.screen_shake.add_shake(3, 0.2)
                 if not self.player.alive:
                     self.change_state(GameState.GAME_OVER)
+                    return
                 break
     
     def _handle_spawning(self, dt):
@@ -332,74 +596,361 @@ class GameEngine:
     
     def _spawn_asteroid(self):
         """Spawna um asteroide"""
-        x = random.randint(0, SCREEN_WIDTH)
+        x = self.rng.gameplay.randint(0, SCREEN_WIDTH)
         y = -50
-        size = random.choices([1, 2, 3], weights=[50, 30, 20])[0]
+        size = self.rng.gameplay.choices([1, 2, 3], weights=[50, 30, 20])[0]
         self.asteroids.append(Asteroid(x, y, size))
     
     def _spawn_enemy(self):
         """Spawna um inimigo"""
-        x = random.randint(50, SCREEN_WIDTH - 50)
+        x = self.rng.gameplay.randint(50, SCREEN_WIDTH - 50)
         y = -50
-        enemy_type = random.choices(["basic", "advanced"], weights=[70, 30])[0]
+        enemy_type = self.rng.gameplay.choices(["basic", "advanced"], weights=[70, 30])[0]
         self.enemies.append(Enemy(x, y, enemy_type))
     
     def draw(self):
         """Desenha o jogo"""
+        self.frame_rects = None
+        self.frame_textured = False
+        
         # Delegar desenho para o estado atual
-        self.states[self.current_state].draw(self)
+        with self.profiler.section("draw.total"):
+            self.states[self.current_state].draw(self)
+        
+        # Quadro em texturas: overlay do profiler junto com o HUD
+        if self.frame_textured:
+            overlay = self.profiler.overlay(SCREEN_WIDTH)
+            if overlay is not None:
+                surface, (x, y) = overlay
+                self.texture_queue.submit(surface, x, y, LAYER_HUD)
+            self.texture_queue.flush()
+            return
+        
+        # Overlay do profiler por cima de tudo
+        overlay_rect = self.profiler.draw(self.screen)
+        
+        # Quadro desenhado por retângulos sujos: registra as regiões alteradas
+        if self.frame_rects is not None:
+            if overlay_rect is not None:
+                self.frame_rects.append(overlay_rect)
+            self.dirty_renderer.end_frame(self.frame_rects)
+    
+    def present(self):
+        """Envia o quadro desenhado para a janela"""
+        if self.texture_renderer is not None:
+            if self.frame_textured:
+                self.texture_renderer.present()
+            else:
+                # Telas desenhadas em software (menu, pausa, fim de jogo)
+                self.texture_renderer.present_surface(self.screen)
+            return
+        
+        if self.frame_rects is not None:
+            self.dirty_renderer.present()
+            return
+        
+        # Quadro completo (outros estados, tremida): o próximo parcial recomeça do zero
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.invalidate()
+        pygame.display.flip()
+    
+    def _refresh_static_background(self):
+        """Fundo do modo de retângulos sujos: tela preta com as estrelas atuais"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(BLACK)
+        self.starfield.draw(background)
+        self.dirty_renderer.set_background(background)
+    
+    @contextmanager
+    def _interpolated_positions(self):
+        """Posiciona as entidades entre o tick anterior e o atual durante o desenho"""
+        alpha = self.render_alpha
+        if alpha >= 1.0:
+            yield
+            return
+        
+        saved = []
+        for entity in self._moving_entities():
+            prev, current = entity.prev_pos, entity.pos
+            dx = current.x - prev.x
+            dy = current.y - prev.y
+            # Saltos grandes (wrap-around, reposicionamento) não são interpolados
+            if abs(dx) > SCREEN_WIDTH // 2 or abs(dy) > SCREEN_HEIGHT // 2:
+                continue
+            saved.append((entity, current))
+            entity.pos = Vector2(prev.x + dx * alpha, prev.y + dy * alpha)
+        try:
+            yield
+        finally:
+            for entity, current in saved:
+                entity.pos = current
     
     def draw_game_scene(self):
         """Desenha a cena do jogo (chamado pelos estados)"""
-        self.screen.fill(BLACK)
+        profiler = self.profiler
+        offset = self.screen_shake.get_offset()
+        shake_x = int(offset.x)
+        shake_y = int(offset.y)
         
-        # Create a surface for screen shake effect
-        game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        game_surface.fill(BLACK)
+        # Backend de texturas: a cena do jogo é composta no renderer
+        if self.texture_renderer is not None and self.current_state == GameState.PLAYING:
+            self._draw_game_scene_textured(shake_x, shake_y)
+            return
         
-        # Desenhar no surface do jogo
-        for star in self.stars:
-            star.draw(game_surface)
+        # Modo de retângulos sujos: só durante o jogo e sem tremida de tela
+        if (self.dirty_renderer is not None and self.current_state == GameState.PLAYING
+                and not shake_x and not shake_y):
+            self._draw_game_scene_dirty()
+            return
         
-        for explosion in self.explosions:
-            explosion.draw(game_surface)
+        # Cena no back buffer (sempre o mesmo destino: o SDL refaz a
+        # codificação RLE das camadas de estrelas a cada destino novo)
+        back_buffer = self.back_buffer
+        back_buffer.fill(BLACK)
         
-        for bullet in self.bullets:
-            bullet.draw(game_surface)
+        with profiler.section("draw.stars"):
+            self.starfield.draw(back_buffer)
         
-        for bullet in self.enemy_bullets:
-            bullet.draw(game_surface)
+        self._draw_scene_layers(back_buffer)
         
-        for asteroid in self.asteroids:
-            asteroid.draw(game_surface)
+        # Apply screen shake offset: só as faixas descobertas pela tremida são limpas
+        with profiler.section("draw.shake_blit"):
+            self._clear_shake_border(self.screen, shake_x, shake_y)
+            self.screen.blit(back_buffer, (shake_x, shake_y))
         
-        for enemy in self.enemies:
-            enemy.draw(game_surface)
+        # HUD (drawn on main screen, not affected by shake)
+        with profiler.section("draw.hud"):
+            self.hud.draw_game_hud(self.screen, self.player, self.score, self.high_score, self.wave)
+    
+    @staticmethod
+    def _clear_shake_border(target, shake_x, shake_y):
+        """Pinta de preto as faixas de `target` que o back buffer deslocado não cobre"""
+        width, height = target.get_size()
+        if shake_x > 0:
+            target.fill(BLACK, (0, 0, shake_x, height))
+        elif shake_x < 0:
+            target.fill(BLACK, (width + shake_x, 0, -shake_x, height))
+        if shake_y > 0:
+            target.fill(BLACK, (0, 0, width, shake_y))
+        elif shake_y < 0:
+            target.fill(BLACK, (0, height + shake_y, width, -shake_y))
+    
+    def _draw_game_scene_textured(self, shake_x, shake_y):
+        """Compõe a cena com texturas; o que usa pygame.draw vai para overlays"""
+        profiler = self.profiler
+        backend = self.texture_renderer
+        queue = self.texture_queue
+        queue.clear()
+        backend.begin_frame()
+        
+        with profiler.section("draw.stars"):
+            self.starfield.submit(queue, LAYER_BACKGROUND)
+        
+        with profiler.section("draw.explosions"):
+            effects = backend.overlay("effects")
+            for explosion in self.explosions:
+                explosion.draw(effects)
+            self.particles.draw(effects)
+            queue.submit(effects, 0, 0, LAYER_EFFECTS)
+        
+        with self._interpolated_positions():
+            with profiler.section("draw.bullets"):
+                self._submit_entities(queue, self.bullets, LAYER_BULLETS)
+                self._submit_entities(queue, self.enemy_bullets, LAYER_BULLETS)
+            
+            with profiler.section("draw.asteroids"):
+                self._submit_entities(queue, self.asteroids, LAYER_ASTEROIDS)
+            
+            actors = backend.overlay("actors")
+            with profiler.section("draw.enemies"):
+                self._draw_entities(actors, self.enemies)
+            
+            with profiler.section("draw.powerups"):
+                self._draw_entities(actors, self.powerups)
+            
+            with profiler.section("draw.player"):
+                self.player.particle_system.draw(actors)
+                queue.submit(actors, 0, 0, LAYER_ACTORS)
+                self.player.submit(queue, LAYER_PLAYER)
         
-        for powerup in self.powerups:
-            powerup.draw(game_surface)
+        # Cena deslocada pela tremida; o HUD vai sem deslocamento, depois
+        with profiler.section("draw.flush"):
+            queue.flush(max_layer=LAYER_PLAYER, offset=(shake_x, shake_y))
         
-        self.player.draw(game_surface)
+        with profiler.section("draw.hud"):
+            for sprite, (x, y) in self.hud.game_hud_sprites(self.player, self.score, self.high_score, self.wave):
+                queue.submit(sprite, x, y, LAYER_HUD)
         
-        # Apply screen shake offset
-        offset = self.screen_shake.get_offset()
-        shake_x = int(offset.x)
-        shake_y = int(offset.y)
-        self.screen.blit(game_surface, (shake_x, shake_y))
+        self.frame_textured = True
+    
+    def _draw_game_scene_dirty(self):
+        """Desenha a cena direto na tela, restaurando o fundo só onde mudou"""
+        profiler = self.profiler
+        rects = []
         
-        # HUD (drawn on main screen, not affected by shake)
-        self.hud.draw_game_hud(self.screen, self.player, self.score, self.high_score, self.wave)
+        with profiler.section("draw.restore"):
+            self.dirty_renderer.begin_frame(self.screen)
+        
+        self._draw_scene_layers(self.screen, rects)
+        
+        with profiler.section("draw.hud"):
+            rects.extend(self.hud.draw_game_hud(self.screen, self.player, self.score,
+                                                self.high_score, self.wave))
+        
+        self.frame_rects = rects
+    
+    def _draw_scene_layers(self, surface, rects=None):
+        """Desenha explosões e entidades; com `rects`, acumula as áreas desenhadas"""
+        profiler = self.profiler
+        
+        with profiler.section("draw.explosions"):
+            for explosion in self.explosions:
+                explosion.draw(surface)
+            self.particles.draw(surface)
+            if rects is not None:
+                for explosion in self.explosions:
+                    rect = explosion.get_draw_rect()
+                    if rect is not None:
+                        rects.append(rect)
+                rects.extend(self.particles.get_dirty_rects())
+        
+        queue = self.render_queue
+        queue.clear()
+        with self._interpolated_positions():
+            with profiler.section("draw.bullets"):
+                self._submit_entities(queue, self.bullets, LAYER_BULLETS, rects)
+                self._submit_entities(queue, self.enemy_bullets, LAYER_BULLETS, rects)
+            
+            with profiler.section("draw.asteroids"):
+                self._submit_entities(queue, self.asteroids, LAYER_ASTEROIDS, rects)
+            
+            # Projéteis e asteroides em lotes, antes das entidades desenhadas diretamente
+            with profiler.section("draw.flush"):
+                queue.flush(surface, LAYER_ASTEROIDS)
+            
+            with profiler.section("draw.enemies"):
+                self._draw_entities(surface, self.enemies, rects)
+            
+            with profiler.section("draw.powerups"):
+                self._draw_entities(surface, self.powerups, rects)
+            
+            with profiler.section("draw.player"):
+                self.player.particle_system.draw(surface)
+                self.player.submit(queue, LAYER_PLAYER)
+                queue.flush(surface)
+                if rects is not None:
+                    rects.append(self.player.get_draw_rect())
+                    rects.extend(self.player.particle_system.get_dirty_rects())
+    
+    @staticmethod
+    def _submit_entities(queue, entities, layer, rects=None):
+        """Envia os sprites de uma lista de entidades para a fila de renderização"""
+        for entity in entities:
+            entity.submit(queue, layer)
+        if rects is not None:
+            rects.extend(entity.get_draw_rect() for entity in entities)
+    
+    @staticmethod
+    def _draw_entities(surface, entities, rects=None):
+        """Desenha uma lista de entidades, acumulando seus retângulos se pedido"""
+        for entity in entities:
+            entity.draw(surface)
+        if rects is not None:
+            rects.extend(entity.get_draw_rect() for entity in entities)
+    
+    def step(self, keys=None, shoot=False):
+        """Avança a simulação um tick fixo (API programática para bots e testes)
+        
+        keys: KeyState com as teclas mantidas neste tick (None = nenhuma)
+        shoot: dispara a arma do jogador antes do tick
+        """
+        pygame.event.pump()
+        self.input_keys = keys if keys is not None else KeyState()
+        if shoot:
+            self.queue_shot()
+        self.update(self.tick_dt)
+    
+    def run_headless(self, ticks=None, sessions=None, autofire=False):
+        """Roda a simulação sem desenhar e sem limite de quadros
+        
+        Para após `ticks` ticks ou `sessions` partidas encerradas (o que vier
+        primeiro); partidas perdidas são reiniciadas automaticamente. Com um
+        replay carregado, para ao fim da partida gravada.
+        Retorna um resumo da execução.
+        """
+        if ticks is None and sessions is None and self.replay is None:
+            raise ValueError("run_headless precisa de ticks, sessions ou um replay")
+        
+        if self.current_state != GameState.PLAYING:
+            self.change_state(GameState.PLAYING)
+        
+        scores = []
+        tick = 0
+        start = time.perf_counter()
+        
+        while self.running and (ticks is None or tick < ticks):
+            if self.replay is not None and self.replay.finished:
+                break
+            self.step(shoot=autofire)
+            tick += 1
+            
+            if self.current_state == GameState.GAME_OVER:
+                scores.append(self.score)
+                # Um replay cobre exatamente uma partida
+                if self.replay is not None:
+                    break
+                if sessions is not None and len(scores) >= sessions:
+                    break
+                self.change_state(GameState.PLAYING)
+        
+        elapsed = time.perf_counter() - start
+        sim_time = tick * self.tick_dt
+        return {
+            "ticks": tick,
+            "sim_time": sim_time,
+            "wall_time": elapsed,
+            "speedup": sim_time / elapsed if elapsed > 0 else float("inf"),
+            "sessions": len(scores),
+            "scores": scores,
+            "current_score": self.score,
+        }
     
     def run(self):
         """Loop principal do jogo"""
+        accumulator = 0.0
+        
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time em segundos
+            # Telas paradas (menu, pausa, fim de jogo) rodam a uma taxa menor
+            fps = self.fps if self.current_state == GameState.PLAYING else min(self.fps, IDLE_FPS)
+            frame_time = self.clock.tick(fps) / 1000.0  # Tempo real do quadro em segundos
+            accumulator += frame_time
             
             self.handle_events()
-            self.update(dt)
+            
+            # Simulação em passo fixo, limitada para que picos não se acumulem
+            steps = 0
+            while accumulator >= self.tick_dt and steps < self.max_catchup_steps:
+                with self.profiler.section("update.total"):
+                    self.update(self.tick_dt)
+                accumulator -= self.tick_dt
+                steps += 1
+            if steps == self.max_catchup_steps:
+                accumulator = min(accumulator, self.tick_dt)
+            
+            # Só a cena em jogo avança entre ticks; nos demais estados desenha o último tick
+            if self.current_state == GameState.PLAYING:
+                self.render_alpha = accumulator / self.tick_dt
+            else:
+                self.render_alpha = 1.0
+            
             self.draw()
             
-            pygame.display.flip()
+            self.present()
+            
+            # Replay concluído: encerra a reprodução
+            if self.replay is not None and self.replay.finished:
+                self.running = False
         
+        self.save_recording()
         pygame.quit()
         sys.exit()
@@ -36,6 +36,8 @@ class MenuState(State):
     
     def __init__(self):
         self.blink_timer = 0
+        self.demo_player = None
+        self.static_texts = None
     
     def handle_events(self, game, events):
         import pygame
@@ -47,33 +49,19 @@ class MenuState(State):
     def update(self, game, dt):
         self.blink_timer += dt
         # Atualizar estrelas
-        for star in game.stars:
-            star.update(dt)
+        game.starfield.update(dt)
     
-    def draw(self, game):
-        from ..core.constants import BLACK, CYAN, WHITE, YELLOW, GRAY, SCREEN_WIDTH, SCREEN_HEIGHT
-        from ..entities.player import Player
-        
-        game.screen.fill(BLACK)
+    def _build_static_texts(self, game):
+        """Renderiza e posiciona título e controles uma única vez"""
+        from ..core.constants import CYAN, WHITE, YELLOW, SCREEN_WIDTH, SCREEN_HEIGHT
+        from ..ui.text_cache import TEXT_CACHE
         
-        # Desenhar estrelas
-        for star in game.stars:
-            star.draw(game.screen)
+        texts = []
         
         # Título
-        title_text = game.font_large.render("STELLARCLASH", True, CYAN)
+        title_text = TEXT_CACHE.render(game.font_large, "STELLARCLASH", CYAN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
-        game.screen.blit(title_text, title_rect)
-        
-        # Nave demonstrativa
-        demo_player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        demo_player.draw(game.screen)
-        
-        # Instruções piscantes
-        if int(self.blink_timer * 2) % 2 == 0:
-            start_text = game.font_medium.render("Pressione ESPAÇO para iniciar", True, WHITE)
-            start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 2 // 3))
-            game.screen.blit(start_text, start_rect)
+        texts.append((title_text, title_rect))
         
         # Controles
         controls = [
@@ -86,9 +74,37 @@ class MenuState(State):
         y_offset = SCREEN_HEIGHT * 3 // 4
         for i, text in enumerate(controls):
             color = YELLOW if i == 0 else WHITE
-            control_text = game.font_small.render(text, True, color)
+            control_text = TEXT_CACHE.render(game.font_small, text, color)
             control_rect = control_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset + i * 30))
-            game.screen.blit(control_text, control_rect)
+            texts.append((control_text, control_rect))
+        
+        return texts
+    
+    def draw(self, game):
+        from ..core.constants import BLACK, WHITE, SCREEN_WIDTH, SCREEN_HEIGHT
+        from ..entities.player import Player
+        from ..ui.text_cache import TEXT_CACHE
+        
+        game.screen.fill(BLACK)
+        
+        # Desenhar estrelas
+        game.starfield.draw(game.screen)
+        
+        # Título e controles (renderizados uma única vez)
+        if self.static_texts is None:
+            self.static_texts = self._build_static_texts(game)
+        game.screen.blits(self.static_texts, doreturn=False)
+        
+        # Nave demonstrativa (criada uma vez; o sprite vem do cache de naves)
+        if self.demo_player is None:
+            self.demo_player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.demo_player.draw(game.screen)
+        
+        # Instruções piscantes
+        if int(self.blink_timer * 2) % 2 == 0:
+            start_text = TEXT_CACHE.render(game.font_medium, "Pressione ESPAÇO para iniciar", WHITE)
+            start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 2 // 3))
+            game.screen.blit(start_text, start_rect)
 
 
 class PlayingState(State):
@@ -99,10 +115,7 @@ class PlayingState(State):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    bullets = game.player.shoot()
-                    game.bullets.extend(bullets)
-                    if bullets:
-                        game.sound_manager.play_sound('laser')
+                    game.queue_shot()
                 elif event.key == pygame.K_ESCAPE:
                     game.change_state(GameState.PAUSED)
     
@@ -118,6 +131,8 @@ class GameOverState(State):
     
     def __init__(self):
         self.timer = 0
+        self.texts = None
+        self.texts_key = None
     
     def handle_events(self, game, events):
         import pygame
@@ -131,52 +146,69 @@ class GameOverState(State):
     def update(self, game, dt):
         self.timer += dt
         # Atualizar estrelas
-        for star in game.stars:
-            star.update(dt)
+        game.starfield.update(dt)
     
-    def draw(self, game):
-        from ..core.constants import BLACK, RED, WHITE, YELLOW, GRAY, SCREEN_WIDTH, SCREEN_HEIGHT
-        
-        game.screen.fill(BLACK)
+    def _build_texts(self, game, show_instructions):
+        """Renderiza e posiciona os textos da tela de fim de jogo"""
+        from ..core.constants import RED, WHITE, YELLOW, GRAY, SCREEN_WIDTH, SCREEN_HEIGHT
+        from ..ui.text_cache import TEXT_CACHE
         
-        # Desenhar estrelas
-        for star in game.stars:
-            star.draw(game.screen)
+        texts = []
         
         # Game Over
-        game_over_text = game.font_large.render("FIM DE JOGO", True, RED)
+        game_over_text = TEXT_CACHE.render(game.font_large, "FIM DE JOGO", RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
-        game.screen.blit(game_over_text, game_over_rect)
+        texts.append((game_over_text, game_over_rect))
         
         # Pontuação final
-        final_score_text = game.font_medium.render(f"Pontuação Final: {game.score}", True, WHITE)
+        final_score_text = TEXT_CACHE.render(game.font_medium, f"Pontuação Final: {game.score}", WHITE)
         final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        game.screen.blit(final_score_text, final_score_rect)
+        texts.append((final_score_text, final_score_rect))
         
         # High Score
         if game.score == game.high_score:
-            new_record_text = game.font_medium.render("NOVO RECORDE!", True, YELLOW)
+            new_record_text = TEXT_CACHE.render(game.font_medium, "NOVO RECORDE!", YELLOW)
             new_record_rect = new_record_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-            game.screen.blit(new_record_text, new_record_rect)
+            texts.append((new_record_text, new_record_rect))
         else:
-            high_score_text = game.font_small.render(f"Pontuação Máxima: {game.high_score}", True, YELLOW)
+            high_score_text = TEXT_CACHE.render(game.font_small, f"Pontuação Máxima: {game.high_score}", YELLOW)
             high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-            game.screen.blit(high_score_text, high_score_rect)
+            texts.append((high_score_text, high_score_rect))
         
         # Instruções
-        if self.timer > 2.0:
-            restart_text = game.font_medium.render("Pressione R para reiniciar", True, WHITE)
+        if show_instructions:
+            restart_text = TEXT_CACHE.render(game.font_medium, "Pressione R para reiniciar", WHITE)
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 2 // 3))
-            game.screen.blit(restart_text, restart_rect)
+            texts.append((restart_text, restart_rect))
             
-            menu_text = game.font_small.render("Pressione ESC para voltar ao menu", True, GRAY)
+            menu_text = TEXT_CACHE.render(game.font_small, "Pressione ESC para voltar ao menu", GRAY)
             menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 2 // 3 + 50))
-            game.screen.blit(menu_text, menu_rect)
+            texts.append((menu_text, menu_rect))
+        
+        return texts
+    
+    def draw(self, game):
+        from ..core.constants import BLACK
+        
+        game.screen.fill(BLACK)
+        
+        # Desenhar estrelas
+        game.starfield.draw(game.screen)
+        
+        # Textos refeitos só quando pontuação ou instruções mudam
+        key = (game.score, game.high_score, self.timer > 2.0)
+        if key != self.texts_key:
+            self.texts = self._build_texts(game, key[2])
+            self.texts_key = key
+        game.screen.blits(self.texts, doreturn=False)
 
 
 class PausedState(State):
     """Estado de pausa"""
     
+    def __init__(self):
+        self.frozen_frame = None
+    
     def handle_events(self, game, events):
         import pygame
         for event in events:
@@ -187,24 +219,35 @@ class PausedState(State):
     def update(self, game, dt):
         pass  # Jogo pausado, não atualiza nada
     
-    def draw(self, game):
-        from ..core.constants import BLACK, WHITE, SCREEN_WIDTH, SCREEN_HEIGHT
+    def freeze(self, game):
+        """Congela o último quadro do jogo, já escurecido e com o texto de pausa"""
         import pygame
+        from ..core.constants import BLACK, WHITE, SCREEN_WIDTH, SCREEN_HEIGHT
+        from ..ui.text_cache import TEXT_CACHE
         
-        # Desenha o jogo em cinza
+        # Desenha o jogo uma última vez
         game.draw_game_scene()
+        frame = game.screen.copy()
         
         # Overlay de pausa
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.set_alpha(128)
         overlay.fill(BLACK)
-        game.screen.blit(overlay, (0, 0))
+        frame.blit(overlay, (0, 0))
         
         # Texto de pausa
-        paused_text = game.font_large.render("PAUSADO", True, WHITE)
+        paused_text = TEXT_CACHE.render(game.font_large, "PAUSADO", WHITE)
         paused_rect = paused_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        game.screen.blit(paused_text, paused_rect)
+        frame.blit(paused_text, paused_rect)
         
-        resume_text = game.font_medium.render("Pressione ESC para continuar", True, WHITE)
+        resume_text = TEXT_CACHE.render(game.font_medium, "Pressione ESC para continuar", WHITE)
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
-        game.screen.blit(resume_text, resume_rect)
+        frame.blit(resume_text, resume_rect)
+        
+        self.frozen_frame = frame
+    
+    def draw(self, game):
+        # Quadro congelado na entrada da pausa: um único blit por quadro
+        if self.frozen_frame is None:
+            self.freeze(game)
+        game.screen.blit(self.frozen_frame, (0, 0))
@@ -9,9 +9,11 @@ from .particles import ParticleSystem
 class ExplosionEffect:
     """Classe para efeitos de explosão melhorada"""
     
-    def __init__(self, x, y, size=1, explosion_type="normal"):
+    def __init__(self, x, y, size=1, explosion_type="normal", particle_system=None):
         self.pos = Vector2(x, y)
-        self.particle_system = ParticleSystem()
+        # Com um armazém compartilhado (engine), quem o atualiza e desenha é o dono
+        self.owns_particles = particle_system is None
+        self.particle_system = ParticleSystem() if self.owns_particles else particle_system
         self.lifetime = 1.5
         self.max_lifetime = 1.5
         self.explosion_type = explosion_type
@@ -27,10 +29,20 @@ class ExplosionEffect:
         # Update shockwave
         self.shockwave_radius += 200 * dt
         
+        if not self.owns_particles:
+            return self.lifetime <= 0
+        
         # Update particle system
         self.particle_system.update(dt)
         
-        return self.lifetime <= 0 and len(self.particle_system.particles) == 0
+        return self.lifetime <= 0 and len(self.particle_system) == 0
+    
+    def get_draw_rect(self):
+        """Retângulo da onda de choque (None quando não é desenhada)"""
+        if not 5 < self.shockwave_radius < self.shockwave_max_radius:
+            return None
+        radius = int(self.shockwave_radius) + 2
+        return pygame.Rect(int(self.pos.x) - radius, int(self.pos.y) - radius, radius * 2 + 1, radius * 2 + 1)
     
     def draw(self, screen):
         from ..core.constants import WHITE
@@ -44,4 +56,5 @@ class ExplosionEffect:
                                  int(self.shockwave_radius), 2)
         
         # Draw particles
-        self.particle_system.draw(screen)
+        if self.owns_particles:
+            self.particle_system.draw(screen)
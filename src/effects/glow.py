@@ -0,0 +1,90 @@
+"""
+Cache de sprites de brilho radial (glow) compartilhado pelos desenhos
+"""
+import numpy as np
+import pygame
+from ..core.constants import GLOW_ALPHA_STEP, GLOW_CACHE_MAX_ENTRIES, GLOW_PULSE_SAMPLES
+from ..systems.asset_cache import ASSET_CACHE
+
+
+def quantize_alpha(alpha, step=GLOW_ALPHA_STEP):
+    """Arredonda o alpha para o degrau mais próximo (limita as variações do cache)"""
+    return max(0, min(255, int(round(alpha / step)) * step))
+
+
+
+def pulse_samples(low=0.6, high=1.0, samples=GLOW_PULSE_SAMPLES):
+    """Fatores de pulso igualmente espaçados em [low, high], para pré-renderizar brilhos"""
+    return [low + (high - low) * step / (samples - 1) for step in range(samples)]
+
+
+class GlowCache:
+    """Sprites de círculos concêntricos (cheios ou anéis) com alpha, gerados uma única vez
+
+    Cada camada é (cor, raio, alpha, espessura do anel); espessura 0 significa
+    círculo cheio. Tamanhos pulsantes devem chegar já arredondados para
+    inteiros e alphas variáveis passam por quantize_alpha, mantendo o número
+    de sprites pequeno.
+    """
+
+    def __init__(self, max_entries=GLOW_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._sprites = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_stack(self, layers):
+        """Sprite único com os círculos `layers` sobrepostos, de baixo para cima
+
+        Cada camada é (cor, raio, alpha, espessura), todas concêntricas. A
+        composição é feita uma vez com o operador "over", então um blit do
+        resultado equivale a blitar as camadas uma a uma.
+        """
+        sprite = self._sprites.get(layers)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        if len(self._sprites) >= self.max_entries:
+            del self._sprites[next(iter(self._sprites))]
+        sprite = ASSET_CACHE.surface("glow_stack", layers, lambda: self._render_stack(layers))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        self._sprites[layers] = sprite
+        return sprite
+
+    @staticmethod
+    def _render_stack(layers):
+        size = max(1, max(radius for _, radius, _, _ in layers))
+        # Cor pré-multiplicada e cobertura acumuladas
+        premultiplied = np.zeros((size * 2, size * 2, 3))
+        coverage = np.zeros((size * 2, size * 2))
+        for color, radius, alpha, width in layers:
+            if radius <= 0:
+                continue
+            layer = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(layer, (*color[:3], alpha), (size, size), radius, width)
+            layer_alpha = pygame.surfarray.array_alpha(layer) / 255.0
+            premultiplied *= (1.0 - layer_alpha)[..., None]
+            premultiplied += layer_alpha[..., None] * np.asarray(color[:3], dtype=float)
+            coverage = layer_alpha + coverage * (1.0 - layer_alpha)
+
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        visible = coverage > 0
+        rgb = np.zeros_like(premultiplied)
+        rgb[visible] = premultiplied[visible] / coverage[visible][:, None]
+        pygame.surfarray.pixels3d(surface)[...] = np.rint(rgb).astype(np.uint8)
+        pygame.surfarray.pixels_alpha(surface)[...] = np.rint(coverage * 255).astype(np.uint8)
+        return surface
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def clear(self):
+        """Descarta todos os sprites"""
+        self._sprites.clear()
+
+
+# Cache compartilhado por projéteis, power-ups e escudo do jogador
+GLOW_CACHE = GlowCache()
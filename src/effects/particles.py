@@ -1,173 +1,321 @@
 """
 Sistema de partículas para efeitos visuais
+
+As partículas ficam em colunas NumPy (struct-of-arrays): integração, fade e
+remoção das expiradas são feitas em poucas operações vetorizadas por quadro,
+em vez de um objeto Python por partícula.
 """
-import random
 import math
+import numpy as np
 import pygame
-from ..utils.vector2 import Vector2
-
-
-class Particle:
-    """Classe para partículas individuais"""
-    
-    def __init__(self, x, y, velocity, color, lifetime, particle_type="normal"):
-        self.pos = Vector2(x, y)
-        self.velocity = velocity
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 6)
-        self.type = particle_type
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-180, 180)
-        self.scale = 1.0
-        self.gravity = Vector2(0, 0)
-        
-        # Diferentes tipos de partículas
-        if particle_type == "spark":
-            self.size = random.randint(1, 3)
-            self.gravity = Vector2(0, 200)
-        elif particle_type == "smoke":
-            self.size = random.randint(4, 8)
-            self.gravity = Vector2(0, -50)
-        elif particle_type == "star":
-            self.size = random.randint(2, 4)
-            self.rotation_speed = random.uniform(90, 270)
-    
-    def update(self, dt):
-        self.pos = self.pos + self.velocity * dt
-        self.velocity = self.velocity + self.gravity * dt
-        self.lifetime -= dt
-        self.rotation += self.rotation_speed * dt
-        
-        # Fade out effect com diferentes curvas
-        progress = 1 - (self.lifetime / self.max_lifetime)
-        if self.type == "smoke":
-            alpha = max(0, (self.lifetime / self.max_lifetime) * 0.6)
-            self.scale = 1 + progress * 2  # Smoke expands
-        else:
-            alpha = max(0, self.lifetime / self.max_lifetime)
-            self.scale = 1 - progress * 0.3  # Slight shrinking
-            
-        # Update color with alpha
-        if len(self.color) == 3:
-            self.color = (*self.color, int(255 * alpha))
-        else:
-            self.color = (*self.color[:3], int(255 * alpha))
-    
-    def draw(self, screen):
-        if self.lifetime > 0:
-            size = max(1, int(self.size * self.scale))
-            
-            if self.type == "star":
-                # Draw a rotating star
-                points = []
-                for i in range(8):
-                    angle = math.radians(self.rotation + i * 45)
-                    if i % 2 == 0:
-                        radius = size * 2
-                    else:
-                        radius = size
-                    x = self.pos.x + math.cos(angle) * radius
-                    y = self.pos.y + math.sin(angle) * radius
-                    points.append((x, y))
-                
-                if len(points) > 2:
-                    pygame.draw.polygon(screen, self.color[:3], points)
-            else:
-                pygame.draw.circle(screen, self.color[:3], (int(self.pos.x), int(self.pos.y)), size)
+from ..systems.random_service import RandomService
+from ..core.constants import MAX_PARTICLES, DIRTY_RECT_TILE
+
+rng = RandomService()
+
+# Tipos de partícula
+PARTICLE_NORMAL = 0
+PARTICLE_SPARK = 1
+PARTICLE_SMOKE = 2
+PARTICLE_STAR = 3
+
+PARTICLE_TYPES = {
+    "normal": PARTICLE_NORMAL,
+    "spark": PARTICLE_SPARK,
+    "smoke": PARTICLE_SMOKE,
+    "star": PARTICLE_STAR,
+}
+
+# Propriedades por tipo (indexadas pelo código do tipo)
+GRAVITY_BY_TYPE = np.array([0.0, 200.0, -50.0, 0.0])
+SIZE_MIN_BY_TYPE = np.array([2, 1, 4, 2])
+SIZE_MAX_BY_TYPE = np.array([6, 3, 8, 4])  # inclusivo
+SPIN_MIN_BY_TYPE = np.array([-180.0, -180.0, -180.0, 90.0])
+SPIN_MAX_BY_TYPE = np.array([180.0, 180.0, 180.0, 270.0])
+
+# Ângulos das pontas da estrela (8 pontas alternando raio cheio/metade)
+STAR_POINT_ANGLES = np.radians(np.arange(8) * 45.0)
+STAR_POINT_RADII = np.where(np.arange(8) % 2 == 0, 2.0, 1.0)
+
+
+def _mapped_colors(surface, colors):
+    """Converte cores RGB (n, 3) em inteiros no formato de pixel da superfície
+
+    Inteiros mapeados são aceitos diretamente por pygame.draw e evitam criar
+    uma lista de cor por partícula a cada quadro.
+    """
+    if surface.get_bitsize() < 24:
+        return np.array([surface.map_rgb(color) for color in colors.tolist()], dtype=np.int64)
+    red_shift, green_shift, blue_shift, _ = surface.get_shifts()
+    colors = colors.astype(np.int64)
+    return ((colors[:, 0] << red_shift) | (colors[:, 1] << green_shift) |
+            (colors[:, 2] << blue_shift) | surface.get_masks()[3])
 
 
 class ParticleSystem:
-    """Sistema de gerenciamento de partículas"""
-    
-    def __init__(self):
-        self.particles = []
-    
-    def add_particle(self, particle):
-        """Adiciona uma partícula ao sistema"""
-        self.particles.append(particle)
-    
+    """Armazém de partículas em colunas NumPy"""
+
+    def __init__(self, capacity=256, max_particles=MAX_PARTICLES):
+        self.max_particles = max_particles
+        self.count = 0
+        self._allocate(min(capacity, max_particles))
+        # Emissões unitárias (rastros, faíscas) são agrupadas até o próximo update
+        self._pending = []
+
+    def _allocate(self, capacity):
+        """Cria as colunas com a capacidade informada"""
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.gravity = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.max_lifetime = np.ones(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.zeros(capacity)
+        self.scale = np.ones(capacity)
+        self.rotation = np.zeros(capacity)
+        self.rotation_speed = np.zeros(capacity)
+
+    def _columns(self):
+        return (self.pos, self.vel, self.gravity, self.lifetime, self.max_lifetime, self.kind,
+                self.color, self.size, self.scale, self.rotation, self.rotation_speed)
+
+    def _reserve(self, extra):
+        """Garante espaço para mais `extra` partículas; retorna quantas cabem"""
+        needed = self.count + extra
+        if needed > self.capacity and self.capacity < self.max_particles:
+            old = self._columns()
+            count = self.count
+            self._allocate(min(self.max_particles, max(needed, self.capacity * 2)))
+            for new_column, old_column in zip(self._columns(), old):
+                new_column[:count] = old_column[:count]
+        return max(0, min(extra, self.capacity - self.count))
+
+    def __len__(self):
+        return self.count + len(self._pending)
+
+    def emit(self, x, y, vx, vy, color, lifetime, particle_type="normal"):
+        """Emite um lote de partículas
+
+        Posições, velocidades, cores (RGB ou (n, 3)), tempos de vida e tipos
+        (nome ou array de códigos) podem ser escalares ou arrays do mesmo
+        tamanho. Partículas além de max_particles são descartadas.
+        """
+        x, y, vx, vy, lifetime = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+            np.asarray(vx, dtype=float), np.asarray(vy, dtype=float),
+            np.asarray(lifetime, dtype=float))
+        total = x.size
+        n = self._reserve(total)
+        if n == 0:
+            return 0
+
+        if isinstance(particle_type, str):
+            kinds = np.full(n, PARTICLE_TYPES[particle_type], dtype=np.int8)
+        else:
+            kinds = np.broadcast_to(np.asarray(particle_type, dtype=np.int8), (total,))[:n]
+
+        generator = rng.cosmetic_array
+        start, end = self.count, self.count + n
+        self.pos[start:end, 0] = x.ravel()[:n]
+        self.pos[start:end, 1] = y.ravel()[:n]
+        self.vel[start:end, 0] = vx.ravel()[:n]
+        self.vel[start:end, 1] = vy.ravel()[:n]
+        self.lifetime[start:end] = lifetime.ravel()[:n]
+        self.max_lifetime[start:end] = lifetime.ravel()[:n]
+        self.kind[start:end] = kinds
+        self.color[start:end] = np.broadcast_to(np.asarray(color, dtype=np.uint8)[..., :3], (total, 3))[:n]
+        self.gravity[start:end] = GRAVITY_BY_TYPE[kinds]
+        self.size[start:end] = generator.integers(SIZE_MIN_BY_TYPE[kinds], SIZE_MAX_BY_TYPE[kinds] + 1)
+        self.scale[start:end] = 1.0
+        self.rotation[start:end] = generator.uniform(0, 360, n)
+        self.rotation_speed[start:end] = generator.uniform(SPIN_MIN_BY_TYPE[kinds], SPIN_MAX_BY_TYPE[kinds])
+        self.count = end
+        return n
+
+    def emit_point(self, x, y, vx, vy, color, lifetime, particle_type="normal"):
+        """Agenda uma única partícula; é gravada em lote no próximo update"""
+        self._pending.append((x, y, vx, vy, color[0], color[1], color[2],
+                              lifetime, PARTICLE_TYPES[particle_type]))
+
+    def _flush_pending(self):
+        """Grava as emissões unitárias agendadas em uma única operação"""
+        if not self._pending:
+            return
+        data = np.array(self._pending)
+        self._pending.clear()
+        self.emit(data[:, 0], data[:, 1], data[:, 2], data[:, 3],
+                  data[:, 4:7], data[:, 7], data[:, 8])
+
+    def _emit_radial(self, x, y, count, speed_min, speed_max, color, lifetime, particle_type):
+        """Emite `count` partículas em direções aleatórias a partir de (x, y)"""
+        generator = rng.cosmetic_array
+        angle = generator.uniform(0, 2 * math.pi, count)
+        speed = generator.uniform(speed_min, speed_max, count)
+        return self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                         color, lifetime, particle_type)
+
     def create_explosion(self, x, y, size=1, explosion_type="normal"):
         """Cria uma explosão de partículas"""
         from ..core.constants import RED, ORANGE, YELLOW, WHITE, GRAY, CYAN
-        
+
+        generator = rng.cosmetic_array
+
         # Partículas principais da explosão
         num_particles = int(30 * size)
-        for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 300) * size
-            velocity = Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            
-            # Diferentes tipos de partículas na explosão
-            if random.random() < 0.4:
-                color = random.choice([RED, ORANGE])
-                particle_type = "normal"
-                lifetime = random.uniform(0.8, 1.5)
-            elif random.random() < 0.7:
-                color = YELLOW
-                particle_type = "spark"
-                lifetime = random.uniform(0.5, 1.0)
-            else:
-                color = WHITE
-                particle_type = "star"
-                lifetime = random.uniform(1.0, 1.8)
-                
-            particle = Particle(x, y, velocity, color, lifetime, particle_type)
-            self.add_particle(particle)
-        
+        if num_particles > 0:
+            angle = generator.uniform(0, 2 * math.pi, num_particles)
+            speed = generator.uniform(80, 300, num_particles) * size
+
+            # Diferentes tipos de partículas na explosão:
+            # 40% fogo (vermelho/laranja), depois 70% faíscas e o resto estrelas
+            fire = generator.random(num_particles) < 0.4
+            spark = ~fire & (generator.random(num_particles) < 0.7)
+            star = ~fire & ~spark
+
+            fire_colors = np.array([RED, ORANGE], dtype=np.uint8)
+            colors = np.empty((num_particles, 3), dtype=np.uint8)
+            colors[fire] = fire_colors[generator.integers(0, 2, int(fire.sum()))]
+            colors[spark] = YELLOW
+            colors[star] = WHITE
+
+            kinds = np.where(spark, PARTICLE_SPARK, np.where(star, PARTICLE_STAR, PARTICLE_NORMAL))
+            lifetime = np.where(fire, generator.uniform(0.8, 1.5, num_particles),
+                                np.where(spark, generator.uniform(0.5, 1.0, num_particles),
+                                         generator.uniform(1.0, 1.8, num_particles)))
+
+            self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed, colors, lifetime, kinds)
+
         # Partículas de fumaça para explosões maiores
         if size > 1:
-            for _ in range(int(10 * size)):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(30, 100) * size
-                velocity = Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-                smoke_particle = Particle(x, y, velocity, GRAY, 
-                                        random.uniform(1.0, 2.0), "smoke")
-                self.add_particle(smoke_particle)
-        
+            count = int(10 * size)
+            self._emit_radial(x, y, count, 30 * size, 100 * size, GRAY,
+                              generator.uniform(1.0, 2.0, count), "smoke")
+
         # Onda de choque para explosões grandes
         if explosion_type == "big" or size > 2:
-            for _ in range(20):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(200, 400)
-                velocity = Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-                shockwave_particle = Particle(x, y, velocity, CYAN, 0.3)
-                self.add_particle(shockwave_particle)
-    
-    def create_engine_particles(self, x, y, velocity_offset=None):
+            self._emit_radial(x, y, 20, 200, 400, CYAN, 0.3, "normal")
+
+    def create_engine_particles(self, x, y, velocity_offset=None, color=None):
         """Cria partículas do motor da nave"""
         from ..core.constants import ORANGE, CYAN
-        
-        for _ in range(3):
-            particle_x = x + random.uniform(-8, 8)
-            particle_y = y + 15
-            particle_vel = Vector2(
-                random.uniform(-80, 80), 
-                random.uniform(80, 150)
-            )
-            
-            if velocity_offset:
-                particle_vel = particle_vel + velocity_offset
-            
-            # Diferentes tipos de partículas do motor
-            if random.random() < 0.7:
-                particle = Particle(particle_x, particle_y, particle_vel, ORANGE, 0.6)
-            else:
-                particle = Particle(particle_x, particle_y, particle_vel, CYAN, 0.4, "spark")
-            self.add_particle(particle)
-    
+
+        flame_color = color if color is not None else ORANGE
+        generator = rng.cosmetic_array
+        count = 3
+
+        vx = generator.uniform(-80, 80, count)
+        vy = generator.uniform(80, 150, count)
+        if velocity_offset:
+            vx += velocity_offset.x
+            vy += velocity_offset.y
+
+        # Diferentes tipos de partículas do motor
+        flame = generator.random(count) < 0.7
+        colors = np.where(flame[:, np.newaxis], np.array(flame_color[:3]), np.array(CYAN))
+        self.emit(x + generator.uniform(-8, 8, count), y + 15, vx, vy, colors,
+                  np.where(flame, 0.6, 0.4), np.where(flame, PARTICLE_NORMAL, PARTICLE_SPARK))
+
+    def create_damage_particles(self, x, y, color=None):
+        """Cria faíscas de impacto quando a nave recebe dano"""
+        from ..core.constants import WHITE, RED
+
+        spark_color = color if color is not None else WHITE
+        generator = rng.cosmetic_array
+        count = 15
+
+        angle = generator.uniform(0, 2 * math.pi, count)
+        speed = generator.uniform(100, 250, count)
+        spark = generator.random(count) < 0.5
+        colors = np.where(spark[:, np.newaxis], np.array(spark_color[:3]), np.array(RED))
+        lifetime = np.where(spark, generator.uniform(0.3, 0.6, count), generator.uniform(0.4, 0.8, count))
+        self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed, colors, lifetime,
+                  np.where(spark, PARTICLE_SPARK, PARTICLE_NORMAL))
+
     def update(self, dt):
-        """Atualiza todas as partículas"""
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update(dt)
-    
+        """Integra, aplica o fade e remove as partículas expiradas"""
+        self._flush_pending()
+        n = self.count
+        if n == 0:
+            return
+
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        pos += vel * dt
+        vel[:, 1] += self.gravity[:n] * dt
+
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        self.rotation[:n] += self.rotation_speed[:n] * dt
+
+        # Fade out com diferentes curvas: fumaça expande, o resto encolhe levemente
+        progress = 1.0 - lifetime / self.max_lifetime[:n]
+        self.scale[:n] = np.where(self.kind[:n] == PARTICLE_SMOKE, 1.0 + progress * 2.0, 1.0 - progress * 0.3)
+
+        # Compactação: mantém apenas as vivas no início das colunas
+        alive = lifetime > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < n:
+            for column in self._columns():
+                column[:alive_count] = column[:n][alive]
+            self.count = alive_count
+
     def draw(self, screen):
         """Desenha todas as partículas"""
-        for particle in self.particles:
-            particle.draw(screen)
-    
+        n = self.count
+        if n == 0:
+            return
+
+        sizes = np.maximum(1, (self.size[:n] * self.scale[:n]).astype(np.int32))
+        kinds = self.kind[:n]
+        colors = _mapped_colors(screen, self.color[:n])
+        star = kinds == PARTICLE_STAR
+
+        # Círculos (normal, faísca, fumaça)
+        circles = ~star
+        if circles.any():
+            xs = self.pos[:n, 0][circles].astype(np.int32).tolist()
+            ys = self.pos[:n, 1][circles].astype(np.int32).tolist()
+            draw_circle = pygame.draw.circle
+            for x, y, radius, color in zip(xs, ys, sizes[circles].tolist(), colors[circles].tolist()):
+                draw_circle(screen, color, (x, y), radius)
+
+        # Estrelas giratórias de 8 pontas
+        if star.any():
+            angles = np.radians(self.rotation[:n][star])[:, np.newaxis] + STAR_POINT_ANGLES
+            radii = sizes[star][:, np.newaxis] * STAR_POINT_RADII
+            points = np.empty(angles.shape + (2,))
+            points[..., 0] = self.pos[:n, 0][star][:, np.newaxis] + np.cos(angles) * radii
+            points[..., 1] = self.pos[:n, 1][star][:, np.newaxis] + np.sin(angles) * radii
+            draw_polygon = pygame.draw.polygon
+            for polygon, color in zip(points.tolist(), colors[star].tolist()):
+                draw_polygon(screen, color, polygon)
+
+    def get_dirty_rects(self, tile=DIRTY_RECT_TILE):
+        """Retângulos que cobrem as partículas, uma caixa justa por bloco de `tile` pixels"""
+        n = self.count
+        if n == 0:
+            return []
+        pos = self.pos[:n]
+        # Raio desenhado: estrelas chegam ao dobro do tamanho
+        reach = self.size[:n] * self.scale[:n] * np.where(self.kind[:n] == PARTICLE_STAR, 2.0, 1.0) + 2
+
+        cells = np.floor_divide(pos, tile).astype(np.int64)
+        keys = cells[:, 0] * 65536 + cells[:, 1]
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+
+        left = np.minimum.reduceat(pos[order, 0] - reach[order], starts)
+        top = np.minimum.reduceat(pos[order, 1] - reach[order], starts)
+        right = np.maximum.reduceat(pos[order, 0] + reach[order], starts)
+        bottom = np.maximum.reduceat(pos[order, 1] + reach[order], starts)
+        boxes = np.stack([np.floor(left), np.floor(top),
+                          np.ceil(right - np.floor(left)) + 1, np.ceil(bottom - np.floor(top)) + 1], axis=1)
+        return [pygame.Rect(box) for box in boxes.astype(np.int64).tolist()]
+
     def clear(self):
         """Remove todas as partículas"""
-        self.particles.clear()
+        self.count = 0
+        self._pending.clear()
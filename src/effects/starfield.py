@@ -0,0 +1,137 @@
+"""
+Campo de estrelas do fundo em camadas pré-renderizadas (parallax)
+"""
+import math
+import pygame
+from ..core.constants import (SCREEN_WIDTH, SCREEN_HEIGHT, STARFIELD_STARS, STARFIELD_LAYER_SPEEDS,
+                              STARFIELD_TWINKLE_FRAMES, STARFIELD_TWINKLE_PERIOD)
+from ..systems.random_service import RandomService
+
+rng = RandomService()
+
+
+class StarLayer:
+    """Uma camada de estrelas com a mesma velocidade, repetida verticalmente
+
+    Cada quadro de cintilação é uma faixa com o dobro da altura da tela (o
+    mesmo céu duas vezes, empilhado): qualquer rolagem é uma janela contínua
+    dessa faixa, desenhada com um único blit e sem emenda. As faixas estão no
+    formato da tela, com colorkey preto e RLEACCEL: o blit pula as áreas
+    vazias, então o custo quase não depende do número de estrelas (e o SDL
+    descarta os pixels brutos depois de codificar, mantendo os quadros leves
+    na memória).
+    """
+
+    def __init__(self, width, height, speed, stars, twinkle_frames):
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.scroll = 0.0
+        self.frames = [self._bake(stars, frame, twinkle_frames) for frame in range(twinkle_frames)]
+
+    def _bake(self, stars, frame, twinkle_frames):
+        """Desenha as estrelas com o brilho do quadro de cintilação `frame`"""
+        surface = pygame.Surface((self.width, self.height * 2))
+        if pygame.display.get_surface() is not None:
+            # Mesmo formato da tela: requisito para o blit RLE rápido
+            surface = surface.convert()
+        surface.fill((0, 0, 0))
+
+        phase = 2 * math.pi * frame / twinkle_frames
+        for star in stars:
+            twinkle = 0.8 + 0.2 * math.sin(star["twinkle_rate"] * phase + star["twinkle_offset"])
+            brightness = max(1, int(star["brightness"] * twinkle))
+            # Duas cópias do céu, mais as vizinhas: estrelas na borda continuam do outro lado
+            for y in range(star["y"] - self.height, star["y"] + self.height * 3, self.height):
+                self._draw_star(surface, star, star["x"], y, (brightness, brightness, brightness))
+
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surface
+
+    @staticmethod
+    def _draw_star(surface, star, x, y, color):
+        size = star["size"]
+        if star["type"] == "bright" and size > 2:
+            # Cruz de brilho para estrelas brilhantes
+            pygame.draw.circle(surface, color, (x, y), size)
+            sparkle_size = max(1, size - 1)
+            pygame.draw.line(surface, color, (x - sparkle_size * 2, y), (x + sparkle_size * 2, y), 1)
+            pygame.draw.line(surface, color, (x, y - sparkle_size * 2), (x, y + sparkle_size * 2), 1)
+        else:
+            pygame.draw.circle(surface, color, (x, y), size)
+
+    def update(self, dt):
+        self.scroll = (self.scroll + self.speed * dt) % self.height
+
+    def draw(self, screen, frame):
+        # A faixa desce `offset` pixels; a metade de cima cobre o topo da tela
+        offset = int(self.scroll)
+        screen.blit(self.frames[frame], (0, offset - self.height))
+    
+    def submit(self, queue, frame, layer):
+        offset = int(self.scroll)
+        queue.submit(self.frames[frame], 0, offset - self.height, layer)
+
+
+class Starfield:
+    """Fundo estrelado: poucas camadas rolando em velocidades diferentes"""
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, star_count=STARFIELD_STARS,
+                 layer_speeds=STARFIELD_LAYER_SPEEDS, twinkle_frames=STARFIELD_TWINKLE_FRAMES,
+                 twinkle_period=STARFIELD_TWINKLE_PERIOD):
+        self.twinkle_frames = twinkle_frames
+        self.twinkle_period = twinkle_period
+        self.time = 0.0
+
+        # Cada estrela vai para a camada de velocidade mais próxima da sua
+        groups = [[] for _ in layer_speeds]
+        for _ in range(star_count):
+            star = self._generate_star(width, height)
+            speed = star["speed"]
+            layer = min(range(len(layer_speeds)), key=lambda i: abs(layer_speeds[i] - speed))
+            groups[layer].append(star)
+
+        self.layers = [StarLayer(width, height, speed, stars, twinkle_frames)
+                       for speed, stars in zip(layer_speeds, groups)]
+
+    @staticmethod
+    def _generate_star(width, height):
+        """Sorteia posição, brilho, tamanho e cintilação de uma estrela"""
+        star = {
+            "x": rng.cosmetic.randint(0, width - 1),
+            "y": rng.cosmetic.randint(0, height - 1),
+            "speed": rng.cosmetic.uniform(0.5, 4.0) * 30,
+            "brightness": rng.cosmetic.randint(100, 255),
+            "size": rng.cosmetic.randint(1, 4),
+            # Estrelas que cintilam no dobro da frequência base
+            "twinkle_rate": rng.cosmetic.choice([1, 2]),
+            "twinkle_offset": rng.cosmetic.uniform(0, math.pi * 2),
+            "type": rng.cosmetic.choice(["normal", "bright", "distant"]),
+        }
+        if star["type"] == "bright":
+            star["brightness"] = rng.cosmetic.randint(180, 255)
+            star["size"] = rng.cosmetic.randint(2, 4)
+        elif star["type"] == "distant":
+            star["brightness"] = rng.cosmetic.randint(60, 120)
+            star["size"] = 1
+        return star
+
+    def update(self, dt):
+        self.time = (self.time + dt) % self.twinkle_period
+        for layer in self.layers:
+            layer.update(dt)
+
+    def current_frame(self):
+        """Quadro de cintilação do instante atual"""
+        return int(self.time / self.twinkle_period * self.twinkle_frames) % self.twinkle_frames
+
+    def draw(self, screen):
+        frame = self.current_frame()
+        for layer in self.layers:
+            layer.draw(screen, frame)
+
+    def submit(self, queue, layer):
+        """Envia as camadas para a fila de renderização"""
+        frame = self.current_frame()
+        for star_layer in self.layers:
+            star_layer.submit(queue, frame, layer)
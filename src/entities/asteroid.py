@@ -2,11 +2,89 @@
 Classe para asteroides
 """
 import pygame
-import random
 import math
+import random
 from .entity import Entity
 from ..utils.vector2 import Vector2
 from ..core.constants import *
+from ..systems.random_service import RandomService
+
+rng = RandomService()
+
+
+class AsteroidSpriteLibrary:
+    """Biblioteca de formas de asteroide com sprites pré-rotacionados
+
+    Cada tamanho tem ASTEROID_SHAPES_PER_SIZE formas irregulares fixas. Na
+    primeira vez que uma forma é usada (intacta ou danificada), ela é
+    rasterizada em ASTEROID_ROTATION_STEPS ângulos; o desenho apenas escolhe
+    o ângulo mais próximo e faz um blit.
+    """
+    
+    def __init__(self, shapes_per_size=ASTEROID_SHAPES_PER_SIZE, rotation_steps=ASTEROID_ROTATION_STEPS):
+        self.shapes_per_size = shapes_per_size
+        self.rotation_steps = rotation_steps
+        self._shapes = {}
+        self._sheets = {}
+        # Gerador próprio: as formas são as mesmas em todas as partidas
+        self._shape_rng = random.Random("asteroid-shapes")
+    
+    def shape(self, size, index):
+        """Pontos (relativos ao centro) da forma `index` do tamanho dado"""
+        shapes = self._shapes.get(size)
+        if shapes is None:
+            radius = size * 8 + 10
+            shapes = self._shapes[size] = [self._generate_shape(radius) for _ in range(self.shapes_per_size)]
+        return shapes[index]
+    
+    def _generate_shape(self, base_radius):
+        """Gera uma forma irregular para o asteroide"""
+        points = []
+        num_points = 8
+        for i in range(num_points):
+            angle = (i / num_points) * 2 * math.pi
+            # Varia o raio para criar forma irregular
+            radius_variation = self._shape_rng.uniform(0.7, 1.3)
+            radius = base_radius * radius_variation
+            x = radius * math.cos(angle)
+            y = radius * math.sin(angle)
+            points.append((x, y))
+        return points
+    
+    def sprite(self, size, index, rotation, damaged=False):
+        """Sprite da forma no ângulo pré-renderizado mais próximo de `rotation` (graus)"""
+        key = (size, index, damaged)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            sheet = self._sheets[key] = self._render_sheet(self.shape(size, index), damaged)
+        step = int(round(rotation * self.rotation_steps / 360.0)) % self.rotation_steps
+        return sheet[step]
+    
+    def _render_sheet(self, points, damaged):
+        """Rasteriza a forma em todos os ângulos"""
+        color = RED if damaged else GRAY
+        half = int(math.ceil(max(math.hypot(x, y) for x, y in points))) + 2
+        convert = pygame.display.get_surface() is not None
+        sheet = []
+        for step in range(self.rotation_steps):
+            angle = math.radians(step * 360.0 / self.rotation_steps)
+            cos_rot = math.cos(angle)
+            sin_rot = math.sin(angle)
+            rotated_points = [(half + x * cos_rot - y * sin_rot, half + x * sin_rot + y * cos_rot)
+                              for x, y in points]
+            
+            surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            pygame.draw.polygon(surface, color, rotated_points)
+            pygame.draw.polygon(surface, WHITE, rotated_points, 2)
+            sheet.append(surface.convert_alpha() if convert else surface)
+        return sheet
+    
+    def __len__(self):
+        return sum(len(sheet) for sheet in self._sheets.values())
+
+
+# Biblioteca compartilhada por todos os asteroides
+ASTEROID_SPRITES = AsteroidSpriteLibrary()
 
 
 class Asteroid(Entity):
@@ -17,30 +95,17 @@ class Asteroid(Entity):
         super().__init__(x, y, radius)
         self.size = size  # 1=pequeno, 2=médio, 3=grande
         self.velocity = Vector2(
-            random.uniform(-100, 100),
-            random.uniform(50, 150)
+            rng.gameplay.uniform(-100, 100),
+            rng.gameplay.uniform(50, 150)
         )
         self.rotation = 0
-        self.rotation_speed = random.uniform(-180, 180)
+        self.rotation_speed = rng.gameplay.uniform(-180, 180)
         self.health = size
         self.max_health = size
         
-        # Gerar pontos do asteroide (forma irregular)
-        self.points = self._generate_asteroid_shape()
-    
-    def _generate_asteroid_shape(self):
-        """Gera uma forma irregular para o asteroide"""
-        points = []
-        num_points = 8
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi
-            # Varia o raio para criar forma irregular
-            radius_variation = random.uniform(0.7, 1.3)
-            radius = self.radius * radius_variation
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            points.append((x, y))
-        return points
+        # Forma irregular sorteada da biblioteca compartilhada
+        self.shape_index = rng.cosmetic.randrange(ASTEROID_SPRITES.shapes_per_size)
+        self.points = ASTEROID_SPRITES.shape(size, self.shape_index)
     
     def update(self, dt):
         self.pos = self.pos + self.velocity * dt
@@ -67,28 +132,30 @@ class Asteroid(Entity):
                 for _ in range(2):
                     child = Asteroid(self.pos.x, self.pos.y, self.size - 1)
                     # Velocidade aleatória para os filhos
-                    angle = random.uniform(0, 2 * math.pi)
-                    speed = random.uniform(100, 200)
+                    angle = rng.gameplay.uniform(0, 2 * math.pi)
+                    speed = rng.gameplay.uniform(100, 200)
                     child.velocity = Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
                     children.append(child)
                 return children
             return []
         return None
     
+    def sprite(self):
+        """Sprite pré-rotacionado no ângulo mais próximo"""
+        damaged = self.health != self.max_health
+        return ASTEROID_SPRITES.sprite(self.size, self.shape_index, self.rotation, damaged)
+    
+    def submit(self, queue, layer):
+        """Envia o sprite do asteroide para a fila de renderização"""
+        if queue.rotates:
+            # O renderer gira o sprite base na cópia
+            damaged = self.health != self.max_health
+            sprite = ASTEROID_SPRITES.sprite(self.size, self.shape_index, 0, damaged)
+            queue.submit_rotated(sprite, self.pos.x, self.pos.y, self.rotation % 360, layer)
+        else:
+            queue.submit_centered(self.sprite(), self.pos.x, self.pos.y, layer)
+    
     def draw(self, screen):
-        # Rotacionar pontos
-        cos_rot = math.cos(math.radians(self.rotation))
-        sin_rot = math.sin(math.radians(self.rotation))
-        
-        rotated_points = []
-        for x, y in self.points:
-            rotated_x = x * cos_rot - y * sin_rot
-            rotated_y = x * sin_rot + y * cos_rot
-            rotated_points.append((
-                self.pos.x + rotated_x,
-                self.pos.y + rotated_y
-            ))
-        
-        color = GRAY if self.health == self.max_health else RED
-        pygame.draw.polygon(screen, color, rotated_points)
-        pygame.draw.polygon(screen, WHITE, rotated_points, 2)
+        sprite = self.sprite()
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (self.pos.x - half, self.pos.y - half))
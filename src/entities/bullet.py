@@ -1,73 +1,112 @@
 """
 Classe para projéteis
 """
-import pygame
 import math
 from .entity import Entity
-from ..utils.vector2 import Vector2
 from ..core.constants import *
-from ..effects.particles import Particle
+from ..utils.object_pool import ObjectPool
+from ..effects.glow import GLOW_CACHE, pulse_samples
+from ..systems.collision import segment_circle_overlap
 
 
 class Bullet(Entity):
     """Classe para os projéteis melhorada"""
     
     def __init__(self, x, y, direction, speed=500, owner="player"):
-        super().__init__(x, y, radius=4 if owner == "player" else 3)
-        self.velocity = Vector2(math.cos(direction), math.sin(direction)) * speed
+        super().__init__(x, y)
+        self.reset(x, y, direction, speed, owner)
+    
+    def reset(self, x, y, direction, speed=500, owner="player"):
+        """Reinicializa o projétil (reutilização pelo BULLET_POOL)
+        
+        Os vetores criados em Entity.__init__ são reaproveitados no lugar.
+        """
+        self.pos.update(x, y)
+        self.prev_pos.update(x, y)
+        self.radius = 4 if owner == "player" else 3
+        self.health = 1
+        self.max_health = 1
+        self.alive = True
+        self.velocity.update(math.cos(direction) * speed, math.sin(direction) * speed)
         self.owner = owner
         self.color = YELLOW if owner == "player" else RED
         self.lifetime = 3.0  # 3 segundos
-        self.trail_particles = []
         self.glow_radius = self.radius * 3
         
         # Animação do projétil
         self.pulse_timer = 0
         self.trail_timer = 0
     
-    def update(self, dt):
-        self.pos = self.pos + self.velocity * dt
+    def update(self, dt, particle_system=None):
+        # Atualização no lugar, sem alocar vetores novos
+        self.prev_pos.x = self.pos.x
+        self.prev_pos.y = self.pos.y
+        self.pos.x += self.velocity.x * dt
+        self.pos.y += self.velocity.y * dt
         self.lifetime -= dt
         self.pulse_timer += dt
         self.trail_timer += dt
         
-        # Create trail particles
+        # Create trail particles (no armazém de partículas da cena)
         if self.trail_timer >= 0.02:  # Every 20ms
-            trail_color = (*self.color, 150)
-            trail_vel = Vector2(-self.velocity.x * 0.1, -self.velocity.y * 0.1)
-            particle = Particle(self.pos.x, self.pos.y, trail_vel, trail_color, 0.3)
-            self.trail_particles.append(particle)
+            if particle_system is not None:
+                particle_system.emit_point(self.pos.x, self.pos.y,
+                                           -self.velocity.x * 0.1, -self.velocity.y * 0.1,
+                                           self.color, 0.3)
             self.trail_timer = 0
         
-        # Update trail particles
-        self.trail_particles = [p for p in self.trail_particles if p.lifetime > 0]
-        for particle in self.trail_particles:
-            particle.update(dt)
-        
         # Check if should be removed
         if self.is_off_screen() or self.lifetime <= 0:
             self.alive = False
     
-    def draw(self, screen):
-        # Draw trail first
-        for particle in self.trail_particles:
-            particle.draw(screen)
-        
-        # Pulsing glow effect
-        pulse = 0.8 + 0.2 * math.sin(self.pulse_timer * 15)
+    def get_draw_radius(self):
+        """O brilho pulsante vai além do raio de colisão"""
+        return self.glow_radius + 2
+    
+    def get_bounding_radius(self):
+        """Raio que cobre todo o trajeto percorrido no último tick"""
+        return self.radius + (self.pos - self.prev_pos).length()
+    
+    def check_collision(self, other):
+        """Verifica colisão ao longo do trajeto do último tick (evita tunelamento)"""
+        return segment_circle_overlap(self.prev_pos.x, self.prev_pos.y, self.pos.x, self.pos.y,
+                                      self.radius, other.pos.x, other.pos.y, other.radius)
+    
+    def sprite(self):
+        """Brilho pulsante e núcleo do quadro atual, compostos em um sprite do cache"""
+        return self._glow(0.8 + 0.2 * math.sin(self.pulse_timer * 15))
+    
+    def _glow(self, pulse):
         glow_size = int(self.glow_radius * pulse)
-        
-        # Outer glow
-        for i in range(3):
-            size = glow_size - i * 2
-            if size > 0:
-                alpha = 30 - i * 10
-                glow_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*self.color, alpha), (size, size), size)
-                screen.blit(glow_surf, (self.pos.x - size, self.pos.y - size))
-        
-        # Main bullet
-        pygame.draw.circle(screen, self.color, (int(self.pos.x), int(self.pos.y)), self.radius)
-        # Inner bright core
         core_color = tuple(min(255, c + 100) for c in self.color)
-        pygame.draw.circle(screen, core_color, (int(self.pos.x), int(self.pos.y)), max(1, self.radius - 1))
+        return GLOW_CACHE.get_stack((
+            # Outer glow
+            (self.color, glow_size, 30, 0),
+            (self.color, glow_size - 2, 20, 0),
+            (self.color, glow_size - 4, 10, 0),
+            # Main bullet
+            (self.color, self.radius, 255, 0),
+            # Inner bright core
+            (core_color, max(1, self.radius - 1), 255, 0),
+        ))
+    
+    @classmethod
+    def prerender_sprites(cls):
+        """Renderiza antecipadamente os brilhos de todos os tamanhos do pulso"""
+        for owner in ("player", "enemy"):
+            bullet = cls(0, 0, 0, owner=owner)
+            for pulse in pulse_samples():
+                bullet._glow(pulse)
+    
+    def submit(self, queue, layer):
+        """Envia o sprite do projétil para a fila de renderização"""
+        queue.submit_centered(self.sprite(), self.pos.x, self.pos.y, layer)
+    
+    def draw(self, screen):
+        sprite = self.sprite()
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (self.pos.x - half, self.pos.y - half))
+
+
+# Pool compartilhado pelos disparos do jogador e dos inimigos
+BULLET_POOL = ObjectPool(Bullet, BULLET_POOL_CAPACITY)
@@ -2,12 +2,14 @@
 Classe para naves inimigas
 """
 import pygame
-import random
 import math
 from .entity import Entity
-from .bullet import Bullet
+from .bullet import BULLET_POOL
 from ..utils.vector2 import Vector2
 from ..core.constants import *
+from ..systems.random_service import RandomService
+
+rng = RandomService()
 
 
 class Enemy(Entity):
@@ -25,7 +27,7 @@ class Enemy(Entity):
         if enemy_type == "basic":
             self.velocity = Vector2(0, 100)
         else:  # advanced
-            self.velocity = Vector2(random.choice([-50, 50]), 80)
+            self.velocity = Vector2(rng.gameplay.choice([-50, 50]), 80)
             self.side_speed = 100
             self.move_timer = 0
     
@@ -72,7 +74,7 @@ class Enemy(Entity):
             angle = math.atan2(direction.y, direction.x)
             
             self.last_shot = 0
-            return [Bullet(self.pos.x, self.pos.y, angle, 300, "enemy")]
+            return [BULLET_POOL.acquire(self.pos.x, self.pos.y, angle, 300, "enemy")]
         return []
     
     def draw(self, screen):
@@ -11,6 +11,7 @@ class Entity(ABC):
     
     def __init__(self, x, y, radius=10):
         self.pos = Vector2(x, y)
+        self.prev_pos = Vector2(x, y)  # Posição no início do tick (interpolação/colisão contínua)
         self.velocity = Vector2(0, 0)
         self.radius = radius
         self.health = 1
@@ -27,11 +28,30 @@ class Entity(ABC):
         """Desenha a entidade"""
         pass
     
+    def save_previous_position(self):
+        """Guarda a posição atual como início do próximo tick"""
+        self.prev_pos.x = self.pos.x
+        self.prev_pos.y = self.pos.y
+    
     def get_rect(self):
         """Retorna o retângulo de colisão"""
         return pygame.Rect(self.pos.x - self.radius, self.pos.y - self.radius,
                           self.radius * 2, self.radius * 2)
     
+    def get_draw_radius(self):
+        """Raio que cobre tudo o que draw() pinta ao redor da posição"""
+        return self.radius * 2 + 2
+    
+    def get_draw_rect(self):
+        """Retângulo desenhado no quadro (renderização por retângulos sujos)"""
+        radius = self.get_draw_radius()
+        return pygame.Rect(int(self.pos.x) - radius, int(self.pos.y) - radius,
+                          radius * 2 + 1, radius * 2 + 1)
+    
+    def get_bounding_radius(self):
+        """Raio usado pela broadphase para cobrir a área ocupada no tick"""
+        return self.radius
+    
     def check_collision(self, other):
         """Verifica colisão com outra entidade"""
         distance = (self.pos - other.pos).length()
@@ -4,16 +4,21 @@ Classe do jogador
 import pygame
 import math
 from .entity import Entity
-from .bullet import Bullet
+from .bullet import BULLET_POOL
 from .ship_types import ShipType, ShipConfig
 from ..utils.vector2 import Vector2
 from ..core.constants import *
 from ..effects.particles import ParticleSystem
+from ..effects.glow import GLOW_CACHE, pulse_samples, quantize_alpha
+from ..systems.asset_cache import ASSET_CACHE
 
 
 class Player(Entity):
     """Classe do jogador"""
     
+    # Sprites pré-renderizados das naves, compartilhados: (ShipType, alpha) -> Surface
+    _ship_sprites = {}
+    
     def __init__(self, x, y, ship_type=ShipType.CLASSIC):
         super().__init__(x, y, radius=12)
         
@@ -132,14 +137,14 @@ class Player(Entity):
                 # Tiro triplo
                 angles = [-0.3, 0, 0.3]  # Ângulos em radianos
                 for angle in angles:
-                    bullets.append(Bullet(self.pos.x, self.pos.y - 15, -math.pi/2 + angle))
+                    bullets.append(BULLET_POOL.acquire(self.pos.x, self.pos.y - 15, -math.pi/2 + angle))
             elif self.ship_type == ShipType.HEAVY:
                 # Nave pesada atira duplo
-                bullets.append(Bullet(self.pos.x - 8, self.pos.y - 15, -math.pi/2))
-                bullets.append(Bullet(self.pos.x + 8, self.pos.y - 15, -math.pi/2))
+                bullets.append(BULLET_POOL.acquire(self.pos.x - 8, self.pos.y - 15, -math.pi/2))
+                bullets.append(BULLET_POOL.acquire(self.pos.x + 8, self.pos.y - 15, -math.pi/2))
             else:
                 # Tiro simples
-                bullets.append(Bullet(self.pos.x, self.pos.y - 15, -math.pi/2))
+                bullets.append(BULLET_POOL.acquire(self.pos.x, self.pos.y - 15, -math.pi/2))
             
             self.last_shot = 0
             return bullets
@@ -186,6 +191,21 @@ class Player(Entity):
         # Desenhar partículas do motor primeiro
         self.particle_system.draw(screen)
         
+        for sprite, x, y in self._sprites():
+            screen.blit(sprite, (x, y))
+    
+    def submit(self, queue, layer):
+        """Envia escudo e nave para a fila (as partículas do motor são desenhadas à parte)"""
+        for sprite, x, y in self._sprites():
+            queue.submit(sprite, x, y, layer)
+    
+    def _sprites(self):
+        """Sprites do quadro atual, de baixo para cima, com o canto superior esquerdo"""
+        # Efeito de piscar quando invulnerável
+        if self.invulnerable_timer > 0:
+            if int(self.invulnerable_timer * 10) % 2 == 0:
+                return ()
+        
         # Efeito de invisibilidade da nave Stealth
         if self.stealth_timer > 0:
             # Nave semi-transparente durante invisibilidade
@@ -193,31 +213,56 @@ class Player(Entity):
         else:
             alpha = 255
         
-        # Efeito de piscar quando invulnerável
-        if self.invulnerable_timer > 0:
-            if int(self.invulnerable_timer * 10) % 2 == 0:
-                return
-        
+        sprites = []
         # Escudo com efeito pulsante
         if self.shield_active:
             pulse = 0.8 + 0.2 * math.sin(pygame.time.get_ticks() * 0.01)
-            shield_radius = int((self.radius + 8) * pulse)
-            
-            # Multiple shield layers for better effect
-            for i in range(3):
-                layer_radius = shield_radius - i * 2
-                layer_alpha = int((100 - i * 30) * pulse)
-                if layer_radius > 0:
-                    shield_surf = pygame.Surface((layer_radius * 2, layer_radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(shield_surf, (*self.color_accent[:3], layer_alpha), 
-                                     (layer_radius, layer_radius), layer_radius, 2)
-                    screen.blit(shield_surf, (self.pos.x - layer_radius, self.pos.y - layer_radius))
-        
-        # Desenhar nave baseada no tipo
-        self._draw_ship_by_type(screen, alpha)
+            shield = self._shield(pulse)
+            half = shield.get_width() // 2
+            sprites.append((shield, self.pos.x - half, self.pos.y - half))
+        
+        # Nave baseada no tipo selecionado
+        sprites.append((self.ship_sprite(alpha), self.pos.x - self.radius * 2, self.pos.y - self.radius * 2))
+        return sprites
+    
+    def _shield(self, pulse):
+        shield_radius = int((self.radius + 8) * pulse)
+        # Multiple shield layers for better effect (anéis compostos em um sprite, alpha quantizado)
+        return GLOW_CACHE.get_stack(tuple(
+            (self.color_accent, shield_radius - i * 2, quantize_alpha((100 - i * 30) * pulse), 2)
+            for i in range(3)))
+    
+    @classmethod
+    def prerender_ships(cls):
+        """Renderiza antecipadamente o sprite opaco de cada tipo de nave"""
+        for ship_type in ShipConfig.SHIPS:
+            cls(0, 0, ship_type).ship_sprite()
+    
+    @classmethod
+    def prerender_shields(cls):
+        """Renderiza antecipadamente o escudo de cada tipo de nave em todos os tamanhos do pulso"""
+        for ship_type in ShipConfig.SHIPS:
+            player = cls(0, 0, ship_type)
+            for pulse in pulse_samples():
+                player._shield(pulse)
+    
+    def ship_sprite(self, alpha=255):
+        """Sprite da nave (4 x raio) com o alpha dado, renderizado uma única vez"""
+        if alpha != 255:
+            alpha = quantize_alpha(alpha, SHIP_ALPHA_STEP)
+        key = (self.ship_type, alpha)
+        sprite = Player._ship_sprites.get(key)
+        if sprite is None:
+            params = (self.ship_type.name, alpha, self.radius,
+                      self.color_primary, self.color_secondary, self.color_accent)
+            sprite = ASSET_CACHE.surface("ship", params, lambda: self._render_ship(alpha))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            Player._ship_sprites[key] = sprite
+        return sprite
     
-    def _draw_ship_by_type(self, screen, alpha=255):
-        """Desenha a nave baseada no tipo selecionado"""
+    def _render_ship(self, alpha):
+        """Rasteriza a nave do tipo atual em uma superfície nova"""
         ship_surf = pygame.Surface((self.radius * 4, self.radius * 4), pygame.SRCALPHA)
         
         if self.ship_type == ShipType.CLASSIC:
@@ -231,7 +276,7 @@ class Player(Entity):
         elif self.ship_type == ShipType.HEAVY:
             self._draw_heavy_ship(ship_surf, alpha)
         
-        screen.blit(ship_surf, (self.pos.x - self.radius * 2, self.pos.y - self.radius * 2))
+        return ship_surf
     
     def _draw_classic_ship(self, surface, alpha):
         """Desenha a nave clássica"""
@@ -2,12 +2,14 @@
 Classe para power-ups
 """
 import pygame
-import random
 import math
 from .entity import Entity
 from ..utils.vector2 import Vector2
 from ..core.constants import *
-from ..effects.particles import Particle
+from ..systems.random_service import RandomService
+from ..effects.glow import GLOW_CACHE, pulse_samples
+
+rng = RandomService()
 
 
 class PowerUp(Entity):
@@ -21,7 +23,6 @@ class PowerUp(Entity):
         self.blink_timer = 0
         self.rotation = 0
         self.pulse_timer = 0
-        self.sparkle_particles = []
         
         # Cores por tipo
         self.colors = {
@@ -31,37 +32,28 @@ class PowerUp(Entity):
         }
         self.color = self.colors.get(type_name, WHITE)
     
-    def update(self, dt):
+    def update(self, dt, particle_system=None):
         self.pos = self.pos + self.velocity * dt
         self.lifetime -= dt
         self.blink_timer += dt
         self.rotation += 90 * dt  # Rotate 90 degrees per second
         self.pulse_timer += dt
         
-        # Create sparkle particles
-        if random.random() < 0.1:  # 10% chance per frame
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(self.radius, self.radius * 1.5)
+        # Create sparkle particles (no armazém de partículas da cena)
+        if particle_system is not None and rng.cosmetic.random() < 0.1:  # 10% chance per frame
+            angle = rng.cosmetic.uniform(0, 2 * math.pi)
+            distance = rng.cosmetic.uniform(self.radius, self.radius * 1.5)
             particle_x = self.pos.x + math.cos(angle) * distance
             particle_y = self.pos.y + math.sin(angle) * distance
-            particle_vel = Vector2(random.uniform(-20, 20), random.uniform(-20, 20))
-            sparkle = Particle(particle_x, particle_y, particle_vel, self.color, 0.8, "star")
-            self.sparkle_particles.append(sparkle)
-        
-        # Update sparkle particles
-        self.sparkle_particles = [p for p in self.sparkle_particles if p.lifetime > 0]
-        for particle in self.sparkle_particles:
-            particle.update(dt)
+            particle_system.emit_point(particle_x, particle_y,
+                                       rng.cosmetic.uniform(-20, 20), rng.cosmetic.uniform(-20, 20),
+                                       self.color, 0.8, "star")
         
         # Check if should be removed
         if self.is_off_screen() or self.lifetime <= 0:
             self.alive = False
     
     def draw(self, screen):
-        # Draw sparkle particles first
-        for particle in self.sparkle_particles:
-            particle.draw(screen)
-            
         # Efeito de piscar quando está acabando o tempo
         if self.lifetime < 3.0:
             if int(self.blink_timer * 10) % 2 == 0:
@@ -69,21 +61,9 @@ class PowerUp(Entity):
         
         # Pulsing glow effect
         pulse_scale = 0.8 + 0.2 * math.sin(self.pulse_timer * 8)
-        glow_radius = int(self.radius * 2 * pulse_scale)
-        
-        # Outer glow
-        for i in range(4):
-            glow_size = glow_radius - i * 3
-            alpha = 40 - i * 10
-            if glow_size > 0:
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*self.color, alpha), (glow_size, glow_size), glow_size)
-                screen.blit(glow_surf, (self.pos.x - glow_size, self.pos.y - glow_size))
-        
-        # Main power-up circle
-        main_radius = int(self.radius * pulse_scale)
-        pygame.draw.circle(screen, self.color, (int(self.pos.x), int(self.pos.y)), main_radius)
-        pygame.draw.circle(screen, WHITE, (int(self.pos.x), int(self.pos.y)), main_radius, 2)
+        glow = self._glow(pulse_scale)
+        half = glow.get_width() // 2
+        screen.blit(glow, (self.pos.x - half, self.pos.y - half))
         
         # Rotating outer ring
         ring_points = []
@@ -133,3 +113,24 @@ class PowerUp(Entity):
                 spark_x = self.pos.x + math.cos(angle) * 8
                 spark_y = self.pos.y + math.sin(angle) * 8
                 pygame.draw.circle(screen, PURPLE, (int(spark_x), int(spark_y)), 2)
+    
+    def _glow(self, pulse_scale):
+        """Outer glow e círculo principal compostos em um sprite do cache"""
+        glow_radius = int(self.radius * 2 * pulse_scale)
+        main_radius = int(self.radius * pulse_scale)
+        return GLOW_CACHE.get_stack((
+            (self.color, glow_radius, 40, 0),
+            (self.color, glow_radius - 3, 30, 0),
+            (self.color, glow_radius - 6, 20, 0),
+            (self.color, glow_radius - 9, 10, 0),
+            (self.color, main_radius, 255, 0),
+            (WHITE, main_radius, 255, 2),
+        ))
+    
+    @classmethod
+    def prerender_sprites(cls):
+        """Renderiza antecipadamente os brilhos de cada tipo em todos os tamanhos do pulso"""
+        for type_name in ("triple_shot", "shield", "neutron_bomb"):
+            powerup = cls(0, 0, type_name)
+            for pulse in pulse_samples():
+                powerup._glow(pulse)
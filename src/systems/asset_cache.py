@@ -0,0 +1,120 @@
+"""
+Cache em disco dos sprites e sons gerados proceduralmente
+"""
+import hashlib
+import os
+import numpy as np
+import pygame
+from ..core.constants import ASSET_CACHE_VERSION
+
+# Diretório padrão, na raiz do projeto
+ASSET_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                               ".asset_cache")
+
+
+class AssetCache:
+    """Assets gerados uma vez e guardados em disco, indexados pelos parâmetros
+
+    Cada asset é identificado por um tipo e pelos parâmetros que o geram
+    (valores simples: números, textos, tuplas); o nome do arquivo é o hash
+    desses parâmetros junto com ASSET_CACHE_VERSION, que deve ser incrementada
+    quando o código de geração mudar. Sprites são guardados em PNG e amostras
+    de som em .npy. Falhas de leitura ou escrita apenas fazem o asset ser
+    gerado de novo.
+
+    Só vale para o que custa mais gerar do que ler do disco: sons sintetizados
+    amostra a amostra e sprites compostos (naves, pilhas de brilho). Folhas de
+    rotação dos asteroides e camadas de estrelas são mais rápidas de desenhar
+    com pygame.draw do que de decodificar e continuam geradas na memória.
+
+    Os sprites voltam como foram gerados ou lidos; converter para o formato
+    da tela (convert_alpha) fica com quem os usa.
+    """
+
+    def __init__(self, directory=ASSET_CACHE_DIR, enabled=True):
+        self.directory = directory
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, directory=None, enabled=True):
+        """Troca o diretório e liga/desliga o cache"""
+        if directory:
+            self.directory = directory
+        self.enabled = enabled
+
+    def key(self, kind, params):
+        """Hash estável do tipo e dos parâmetros de geração"""
+        text = repr((ASSET_CACHE_VERSION, kind, params))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+    def path(self, kind, params, extension):
+        return os.path.join(self.directory, kind, f"{self.key(kind, params)}.{extension}")
+
+    def surface(self, kind, params, build):
+        """Sprite: lido do disco, ou gerado por build() e salvo"""
+        if not self.enabled:
+            return build()
+
+        path = self.path(kind, params, "png")
+        try:
+            surface = pygame.image.load(path)
+            self.hits += 1
+            return surface
+        except (pygame.error, OSError):
+            pass
+
+        self.misses += 1
+        surface = build()
+        try:
+            self._write(path, lambda temp: pygame.image.save(surface, temp, "png"))
+        except (OSError, pygame.error):
+            pass
+        return surface
+
+    def array(self, kind, params, build):
+        """Array NumPy (amostras de som): lido do disco, ou gerado e salvo"""
+        if not self.enabled:
+            return build()
+
+        path = self.path(kind, params, "npy")
+        try:
+            array = np.load(path, allow_pickle=False)
+            self.hits += 1
+            return array
+        except (OSError, ValueError):
+            pass
+
+        self.misses += 1
+        array = build()
+        try:
+            self._write(path, lambda temp: np.save(temp, array, allow_pickle=False))
+        except OSError:
+            pass
+        return array
+
+    def clear(self):
+        """Apaga todos os arquivos do cache"""
+        if not os.path.isdir(self.directory):
+            return
+        for root, _, files in os.walk(self.directory, topdown=False):
+            for name in files:
+                os.remove(os.path.join(root, name))
+            os.rmdir(root)
+
+    @staticmethod
+    def _write(path, save):
+        """Escreve via arquivo temporário, para não deixar arquivos pela metade"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                save(f)
+            os.replace(temp, path)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+
+
+# Cache compartilhado por sprites e sons
+ASSET_CACHE = AssetCache()
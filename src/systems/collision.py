@@ -0,0 +1,91 @@
+"""
+Kernel vetorizado (NumPy) para colisões entre projéteis e alvos
+"""
+import numpy as np
+
+
+def pack_circles(entities):
+    """Empacota posições e raios das entidades em arrays NumPy"""
+    count = len(entities)
+    positions = np.empty((count, 2), dtype=np.float64)
+    radii = np.empty(count, dtype=np.float64)
+    for i, entity in enumerate(entities):
+        positions[i, 0] = entity.pos.x
+        positions[i, 1] = entity.pos.y
+        radii[i] = entity.radius
+    return positions, radii
+
+
+def pack_segments(bullets):
+    """Empacota o trajeto do último tick (posição anterior -> atual) das balas"""
+    count = len(bullets)
+    starts = np.empty((count, 2), dtype=np.float64)
+    ends = np.empty((count, 2), dtype=np.float64)
+    radii = np.empty(count, dtype=np.float64)
+    for i, bullet in enumerate(bullets):
+        starts[i, 0] = bullet.prev_pos.x
+        starts[i, 1] = bullet.prev_pos.y
+        ends[i, 0] = bullet.pos.x
+        ends[i, 1] = bullet.pos.y
+        radii[i] = bullet.radius
+    return starts, ends, radii
+
+
+def segment_circle_overlap(x0, y0, x1, y1, radius, cx, cy, target_radius):
+    """Teste contínuo de um círculo que percorre o segmento (x0, y0) -> (x1, y1)"""
+    dx = x1 - x0
+    dy = y1 - y0
+    length_sq = dx * dx + dy * dy
+    if length_sq > 0:
+        t = ((cx - x0) * dx + (cy - y0) * dy) / length_sq
+        t = max(0.0, min(1.0, t))
+    else:
+        t = 0.0
+    px = cx - (x0 + dx * t)
+    py = cy - (y0 + dy * t)
+    reach = radius + target_radius
+    return px * px + py * py < reach * reach
+
+
+def swept_hit_matrix(starts, ends, bullet_radii, target_pos, target_radii):
+    """Matriz (alvos x balas) com o teste contínuo segmento x círculo"""
+    direction = ends - starts
+    length_sq = np.einsum('ij,ij->i', direction, direction)
+    # Balas paradas (comprimento zero) degeneram para o teste de ponto
+    safe_length_sq = np.where(length_sq > 0, length_sq, 1.0)
+
+    offset = target_pos[:, np.newaxis, :] - starts[np.newaxis, :, :]
+    t = np.einsum('ijk,jk->ij', offset, direction) / safe_length_sq
+    np.clip(t, 0.0, 1.0, out=t)
+
+    delta = offset - t[:, :, np.newaxis] * direction[np.newaxis, :, :]
+    dist_sq = np.einsum('ijk,ijk->ij', delta, delta)
+    reach = target_radii[:, np.newaxis] + bullet_radii[np.newaxis, :]
+    return dist_sq < reach * reach
+
+
+def resolve_first_hits(hits):
+    """Resolve a matriz de acertos na ordem dos alvos: cada alvo recebe a
+    primeira bala livre que o atinge e cada bala atinge no máximo um alvo.
+    Retorna um array com o índice da bala por alvo (-1 quando não há acerto)"""
+    first = np.full(hits.shape[0], -1, dtype=np.intp)
+    if hits.size == 0:
+        return first
+
+    consumed = np.zeros(hits.shape[1], dtype=bool)
+    for target in np.flatnonzero(hits.any(axis=1)):
+        candidates = np.flatnonzero(hits[target] & ~consumed)
+        if candidates.size:
+            first[target] = candidates[0]
+            consumed[candidates[0]] = True
+    return first
+
+
+def first_hits(bullets, targets):
+    """Para cada alvo, índice da primeira bala cujo trajeto no tick o atinge (-1 se nenhuma)"""
+    if not bullets or not targets:
+        return np.full(len(targets), -1, dtype=np.intp)
+
+    starts, ends, bullet_radii = pack_segments(bullets)
+    target_pos, target_radii = pack_circles(targets)
+    return resolve_first_hits(swept_hit_matrix(starts, ends, bullet_radii, target_pos, target_radii))
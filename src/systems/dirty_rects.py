@@ -0,0 +1,73 @@
+"""
+Renderização por retângulos sujos (atualiza só as regiões que mudaram)
+"""
+import pygame
+
+
+class DirtyRectRenderer:
+    """Restaura o fundo e envia à tela apenas as regiões alteradas
+
+    A cada quadro, o fundo é restaurado nos retângulos desenhados no quadro
+    anterior; depois da cena desenhada, pygame.display.update recebe os
+    retângulos antigos e os novos. Quando a área suja passa de
+    `max_dirty_fraction` da tela, ou após invalidate(), o quadro é enviado
+    inteiro.
+    """
+
+    def __init__(self, screen, max_dirty_fraction):
+        self.screen_rect = screen.get_rect()
+        self.max_dirty_area = self.screen_rect.width * self.screen_rect.height * max_dirty_fraction
+        self.background = None
+        self.previous_rects = []
+        self.pending_rects = None
+        self.full_redraw = True
+        # Estatísticas do último quadro (para o profiler)
+        self.last_dirty_count = 0
+        self.last_full = True
+
+    def set_background(self, surface):
+        """Define o fundo estático restaurado sob as entidades"""
+        self.background = surface
+        self.invalidate()
+
+    def invalidate(self):
+        """Força o próximo quadro a ser redesenhado e enviado inteiro"""
+        self.full_redraw = True
+        self.previous_rects = []
+
+    def begin_frame(self, screen):
+        """Prepara a tela: fundo inteiro ou apenas sob os retângulos anteriores"""
+        if self.full_redraw:
+            screen.blit(self.background, (0, 0))
+            return
+        background = self.background
+        for rect in self.previous_rects:
+            screen.blit(background, rect, rect)
+
+    def end_frame(self, rects):
+        """Registra os retângulos desenhados; present() os envia à tela"""
+        rects = [rect.clip(self.screen_rect) for rect in rects]
+        rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+
+        if self.full_redraw:
+            self.pending_rects = None
+        else:
+            dirty = self.previous_rects + rects
+            area = sum(rect.width * rect.height for rect in dirty)
+            self.pending_rects = dirty if area <= self.max_dirty_area else None
+
+        self.previous_rects = rects
+        self.full_redraw = False
+
+    def present(self):
+        """Envia o quadro: só as regiões sujas, ou a tela inteira"""
+        rects = self.pending_rects
+        self.pending_rects = None
+        if rects is None:
+            self.last_full = True
+            self.last_dirty_count = 0
+            pygame.display.flip()
+        else:
+            self.last_full = False
+            self.last_dirty_count = len(rects)
+            pygame.display.update(rects)
@@ -0,0 +1,101 @@
+"""
+Estado de teclado injetável e gravação/replay de entradas por tick
+"""
+import json
+import pygame
+
+
+# Teclas lidas pela simulação; a ordem define o bit de cada uma na máscara gravada
+RECORDED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+)
+SHOOT_BIT = 1 << len(RECORDED_KEYS)
+
+
+class KeyState:
+    """Substituto de pygame.key.get_pressed() com um conjunto de teclas pressionadas"""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Reconstrói o estado a partir de uma máscara de bits gravada"""
+        return cls(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+    @staticmethod
+    def to_mask(keys_pressed):
+        """Converte qualquer estado de teclado em máscara de bits"""
+        mask = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys_pressed[key]:
+                mask |= 1 << bit
+        return mask
+
+    def __repr__(self):
+        return f"KeyState({sorted(self.pressed)})"
+
+
+class InputRecording:
+    """Entradas de uma partida, tick a tick, junto com a semente e a taxa de ticks"""
+
+    VERSION = 1
+
+    def __init__(self, seed, tick_rate, inputs=None):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.inputs = inputs if inputs is not None else []
+
+    def record(self, keys_pressed, shoot):
+        """Registra a entrada de um tick"""
+        entry = KeyState.to_mask(keys_pressed)
+        if shoot:
+            entry |= SHOOT_BIT
+        self.inputs.append(entry)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def save(self, path):
+        """Salva a gravação em JSON"""
+        data = {
+            "version": self.VERSION,
+            "seed": self.seed,
+            "tick_rate": self.tick_rate,
+            "inputs": self.inputs,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """Carrega uma gravação salva por save()"""
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Versão de gravação não suportada: {data.get('version')}")
+        return cls(data["seed"], data["tick_rate"], data["inputs"])
+
+
+class InputReplay:
+    """Reproduz uma InputRecording tick a tick"""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.index = 0
+
+    @property
+    def finished(self):
+        return self.index >= len(self.recording.inputs)
+
+    def next_tick(self):
+        """Retorna (KeyState, shoot) do próximo tick; sem teclas após o fim"""
+        if self.finished:
+            return KeyState(), False
+        entry = self.recording.inputs[self.index]
+        self.index += 1
+        return KeyState.from_mask(entry), bool(entry & SHOOT_BIT)
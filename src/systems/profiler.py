@@ -0,0 +1,133 @@
+"""
+Profiler de quadros com overlay de tempos por subsistema
+"""
+import time
+from collections import deque
+import pygame
+
+
+class _NullSection:
+    """Seção vazia usada quando o profiler está desligado (custo quase zero)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """Mede o tempo de um bloco `with` e envia a amostra ao profiler"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add_sample(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """Coleta tempos por estágio (médias móveis e pior caso) e desenha o overlay"""
+
+    def __init__(self, enabled=False, window=120, refresh_interval=0.25):
+        self.enabled = enabled
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self.samples = {}
+        self.counts = {}
+        self._sections = {}
+        self._font = None
+        self._overlay = None
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        """Liga/desliga a coleta e o overlay"""
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self.reset()
+
+    def reset(self):
+        """Descarta as amostras coletadas"""
+        self.samples.clear()
+        self.counts.clear()
+        self._overlay = None
+
+    def section(self, name):
+        """Contexto que mede um estágio: `with profiler.section("update.player"):`"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def add_sample(self, name, seconds):
+        """Registra uma amostra de tempo (em segundos) para um estágio"""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def set_counts(self, counts):
+        """Atualiza a contagem de entidades exibida no overlay"""
+        self.counts = counts
+
+    def stats(self):
+        """Retorna [(estágio, média ms, pior ms)] na ordem de primeira medição"""
+        result = []
+        for name, samples in self.samples.items():
+            if samples:
+                result.append((name, 1000.0 * sum(samples) / len(samples), 1000.0 * max(samples)))
+        return result
+
+    def draw(self, screen):
+        """Desenha o overlay (re-renderizado a cada refresh_interval); retorna seu retângulo"""
+        overlay = self.overlay(screen.get_width())
+        if overlay is None:
+            return None
+        return screen.blit(*overlay)
+
+    def overlay(self, screen_width):
+        """Superfície do overlay e sua posição, ou None se desativado"""
+        if not self.enabled:
+            return None
+
+        now = time.perf_counter()
+        if self._overlay is None or now - self._last_refresh >= self.refresh_interval:
+            self._overlay = self._render_overlay()
+            self._last_refresh = now
+        return self._overlay, (screen_width - self._overlay.get_width() - 10, 60)
+
+    def _render_overlay(self):
+        """Monta a superfície do overlay com tempos e contagens"""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        lines = [("estágio                 média    pior", (255, 255, 0))]
+        for name, avg_ms, worst_ms in self.stats():
+            lines.append((f"{name:<22} {avg_ms:6.2f} {worst_ms:7.2f}", (255, 255, 255)))
+        if self.counts:
+            lines.append(("entidades", (255, 255, 0)))
+            for name, count in self.counts.items():
+                lines.append((f"{name:<22} {count:6d}", (0, 255, 255)))
+
+        line_height = self._font.get_linesize()
+        rendered = [self._font.render(text, True, color) for text, color in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        overlay = pygame.Surface((width, line_height * len(rendered) + 12), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for i, surface in enumerate(rendered):
+            overlay.blit(surface, (6, 6 + i * line_height))
+        return overlay
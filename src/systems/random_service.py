@@ -0,0 +1,51 @@
+"""
+Serviço de números aleatórios da partida usando Singleton Pattern
+"""
+import random
+import numpy as np
+
+
+class RandomService:
+    """Geradores aleatórios semeados (Singleton)
+
+    O fluxo `gameplay` alimenta tudo que altera o resultado da partida (spawns,
+    velocidades, drops); o fluxo `cosmetic` alimenta efeitos visuais. Assim,
+    partículas e tremidas de tela não desalinham a simulação entre execuções.
+    `cosmetic_array` é o equivalente NumPy do fluxo cosmético, para efeitos
+    gerados em lote.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RandomService, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.seed = None
+        self.gameplay = random.Random()
+        self.cosmetic = random.Random()
+        self.cosmetic_array = np.random.Generator(np.random.PCG64())
+        self.reseed()
+        self._initialized = True
+
+    @staticmethod
+    def new_seed():
+        """Gera uma semente nova a partir da entropia do sistema"""
+        return random.SystemRandom().randrange(2 ** 32)
+
+    def reseed(self, seed=None):
+        """Reinicia os dois fluxos a partir de uma semente (None = aleatória)"""
+        if seed is None:
+            seed = self.new_seed()
+        self.seed = seed
+        # Os objetos são resemeados no lugar para manter válidas as referências
+        self.gameplay.seed(f"{seed}:gameplay")
+        self.cosmetic.seed(f"{seed}:cosmetic")
+        self.cosmetic_array.bit_generator.state = np.random.PCG64([seed, 1]).state
+        return seed
@@ -0,0 +1,75 @@
+"""
+Fila de renderização: comandos de blit agrupados por camada
+"""
+
+# Camadas da cena, de baixo para cima (fundo, efeitos, atores e HUD só
+# passam pela fila no backend de texturas)
+LAYER_BACKGROUND = 0
+LAYER_EFFECTS = 1
+LAYER_BULLETS = 2
+LAYER_ASTEROIDS = 3
+LAYER_ACTORS = 4
+LAYER_PLAYER = 5
+LAYER_HUD = 6
+
+
+class RenderQueue:
+    """Acumula comandos (sprite, posição, camada) e os desenha em lotes
+
+    As entidades enviam seus sprites com submit(); o que está inteiramente
+    fora de `bounds` é descartado antes de entrar na fila. flush() desenha as
+    camadas em ordem crescente, cada uma com uma única chamada a
+    Surface.fblits (pygame-ce) ou Surface.blits.
+    """
+
+    # Filas que giram sprites na cópia (submit_rotated); aqui os sprites já vêm girados
+    rotates = False
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self._layers = {}
+        # Estatísticas do último flush (para o profiler)
+        self.submitted = 0
+        self.culled = 0
+
+    def submit(self, sprite, x, y, layer=0):
+        """Enfileira o sprite com o canto superior esquerdo em (x, y)"""
+        bounds = self.bounds
+        x = int(x)
+        y = int(y)
+        width, height = sprite.get_size()
+        if (x + width <= bounds.left or x >= bounds.right or
+                y + height <= bounds.top or y >= bounds.bottom):
+            self.culled += 1
+            return
+        commands = self._layers.get(layer)
+        if commands is None:
+            commands = self._layers[layer] = []
+        commands.append((sprite, (x, y)))
+        self.submitted += 1
+
+    def submit_centered(self, sprite, x, y, layer=0):
+        """Enfileira o sprite centrado em (x, y)"""
+        width, height = sprite.get_size()
+        self.submit(sprite, x - width // 2, y - height // 2, layer)
+
+    def flush(self, surface, max_layer=None):
+        """Desenha as camadas até `max_layer` (todas, se None) e as retira da fila"""
+        fblits = getattr(surface, "fblits", None)
+        for layer in sorted(self._layers):
+            if max_layer is not None and layer > max_layer:
+                break
+            commands = self._layers.pop(layer)
+            if fblits is not None:
+                fblits(commands)
+            else:
+                surface.blits(commands, doreturn=False)
+
+    def clear(self):
+        """Descarta os comandos pendentes e zera as estatísticas"""
+        self._layers.clear()
+        self.submitted = 0
+        self.culled = 0
+
+    def __len__(self):
+        return sum(len(commands) for commands in self._layers.values())
@@ -1,8 +1,10 @@
 """
 Sistema de Screen Shake para efeitos de impacto
 """
-import random
 from ..utils.vector2 import Vector2
+from .random_service import RandomService
+
+rng = RandomService()
 
 
 class ScreenShake:
@@ -23,15 +25,15 @@ class ScreenShake:
         if self.duration > 0:
             self.duration -= dt
             
-            # Calculate shake offset
-            shake_x = random.uniform(-self.intensity, self.intensity)
-            shake_y = random.uniform(-self.intensity, self.intensity)
-            self.offset = Vector2(shake_x, shake_y)
+            # Calculate shake offset (no lugar, sem alocar vetores)
+            self.offset.x = rng.cosmetic.uniform(-self.intensity, self.intensity)
+            self.offset.y = rng.cosmetic.uniform(-self.intensity, self.intensity)
             
             # Reduce intensity over time
             self.intensity *= 0.95
         else:
-            self.offset = Vector2(0, 0)
+            self.offset.x = 0
+            self.offset.y = 0
             self.intensity = 0
     
     def get_offset(self):
@@ -1,10 +1,48 @@
 """
 Sistema de gerenciamento de sons usando Singleton Pattern
 """
+import random
+import zlib
 import pygame
 import numpy as np
-import math
-import random
+from ..core.constants import (SOUND_SAMPLE_RATE, SOUND_VARIANTS, SOUND_BANK_MAX_BYTES,
+                              SOUND_PITCH_JITTER, SOUND_VOLUME_JITTER, SOUND_ENVELOPE_JITTER,
+                              SOUND_CATEGORY_CHANNELS)
+from .asset_cache import ASSET_CACHE
+from .synth import sample_bytes, synthesize, vary
+from .voice_manager import VoiceManager, coalesced_gain
+
+# Efeitos sonoros sintéticos, declarados como dados para synth.synthesize():
+# volume relativo ao volume de efeitos, duração (s), pico em int16, camadas
+# somadas (sweep em Hz/s) e envelope (attack em s, decay como expoente).
+# Opcionais: "variants" (tamanho do banco) e "jitter" (pitch, volume, envelope).
+# Na mixagem: categoria (canais de SOUND_CATEGORY_CHANNELS), prioridade (a
+# maior rouba canais da menor) e máximo de vozes simultâneas do efeito
+SOUND_EFFECTS = {
+    "laser": {
+        "category": "weapons", "priority": 1, "max_voices": 2,
+        "volume": 0.3, "duration": 0.1, "amplitude": 4096,
+        "layers": [{"wave": "sine", "frequency": 800, "sweep": -800}],  # Frequência decrescente
+    },
+    "explosion": {
+        "category": "explosions", "priority": 1, "max_voices": 3,
+        "volume": 0.4, "duration": 0.5, "amplitude": 2048,
+        "layers": [{"wave": "noise"}],
+        "envelope": {"decay": 2},
+    },
+    "powerup": {
+        "category": "alerts", "priority": 2, "max_voices": 1,
+        "volume": 0.4, "duration": 0.3, "amplitude": 4096,
+        "layers": [{"wave": "sine", "frequency": 400, "sweep": 1600}],  # Frequência crescente
+        "envelope": {"decay": 1},
+    },
+    "hit": {
+        "category": "alerts", "priority": 3, "max_voices": 1,
+        "volume": 0.5, "duration": 0.2, "amplitude": 4096,
+        "layers": [{"wave": "sine", "frequency": 200}, {"wave": "noise", "level": 0.3}],
+        "envelope": {"decay": 3},
+    },
+}
 
 
 class SoundManager:
@@ -22,110 +60,101 @@ class SoundManager:
         if self._initialized:
             return
         
+        # Banco de variantes por efeito: nome -> lista de Sounds
         self.sounds = {}
+        self.bank_bytes = 0
         self.music_volume = 0.5
         self.sfx_volume = 0.7
+        # Sorteio das variantes (não consome a aleatoriedade do jogo)
+        self._pick_rng = random.Random("sound-variants")
+        self._last_pick = {}
+        
+        # Canais reservados por categoria; os pedidos de cada tick saem em flush()
+        self.voices = VoiceManager(SOUND_CATEGORY_CHANNELS)
+        for name, effect in SOUND_EFFECTS.items():
+            self.voices.register(name, effect["category"], effect["priority"], effect["max_voices"])
         
         # Criar sons sintéticos simples
         self._create_synthetic_sounds()
         self._initialized = True
     
     def _create_synthetic_sounds(self):
-        """Cria sons sintéticos usando pygame"""
-        self._create_laser_sound()
-        self._create_explosion_sound()
-        self._create_powerup_sound()
-        self._create_hit_sound()
-    
-    def _create_laser_sound(self):
-        """Cria som de laser sintético"""
-        duration = 0.1
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        arr = []
-        for i in range(frames):
-            time = float(i) / sample_rate
-            frequency = 800 - (time * 400)  # Frequência decrescente
-            value = int(4096 * math.sin(frequency * 2 * math.pi * time))
-            arr.append([value, value])
-        
-        sound_array = np.array(arr, dtype=np.int16)
-        sound = pygame.sndarray.make_sound(sound_array)
-        sound.set_volume(self.sfx_volume * 0.3)
-        self.sounds['laser'] = sound
-    
-    def _create_explosion_sound(self):
-        """Cria som de explosão sintético"""
-        duration = 0.5
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        arr = []
-        for i in range(frames):
-            time = float(i) / sample_rate
-            # Ruído com frequência decrescente
-            noise = random.uniform(-1, 1)
-            envelope = (1 - time / duration) ** 2
-            value = int(4096 * noise * envelope * 0.5)
-            arr.append([value, value])
-        
-        sound_array = np.array(arr, dtype=np.int16)
-        sound = pygame.sndarray.make_sound(sound_array)
-        sound.set_volume(self.sfx_volume * 0.4)
-        self.sounds['explosion'] = sound
+        """Sintetiza os bancos de variantes de SOUND_EFFECTS dentro de SOUND_BANK_MAX_BYTES
+
+        As variantes são criadas em rodadas (a primeira de cada efeito, depois
+        a segunda, ...), para que um teto apertado reduza todos os bancos por
+        igual; a variante 0 é o efeito original e existe mesmo acima do teto.
+        """
+        pending = {name: effect.get("variants", SOUND_VARIANTS) for name, effect in SOUND_EFFECTS.items()}
+        self.sounds = {name: [] for name in SOUND_EFFECTS}
+        self.bank_bytes = 0
+        index = 0
+        while pending:
+            for name in list(pending):
+                effect, rng = self._variant(name, index)
+                size = sample_bytes(effect, SOUND_SAMPLE_RATE)
+                if index > 0 and self.bank_bytes + size > SOUND_BANK_MAX_BYTES:
+                    del pending[name]
+                    continue
+                samples = ASSET_CACHE.array("sound", (name, index, SOUND_SAMPLE_RATE, effect),
+                                            lambda: synthesize(effect, SOUND_SAMPLE_RATE, rng))
+                # O volume vai no canal, a cada voz (ver flush)
+                self.sounds[name].append(pygame.sndarray.make_sound(samples))
+                self.bank_bytes += samples.nbytes
+                if len(self.sounds[name]) >= pending[name]:
+                    del pending[name]
+            index += 1
     
-    def _create_powerup_sound(self):
-        """Cria som de power-up sintético"""
-        duration = 0.3
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        arr = []
-        for i in range(frames):
-            time = float(i) / sample_rate
-            frequency = 400 + (time * 800)  # Frequência crescente
-            value = int(4096 * math.sin(frequency * 2 * math.pi * time) * (1 - time / duration))
-            arr.append([value, value])
-        
-        sound_array = np.array(arr, dtype=np.int16)
-        sound = pygame.sndarray.make_sound(sound_array)
-        sound.set_volume(self.sfx_volume * 0.4)
-        self.sounds['powerup'] = sound
+    @staticmethod
+    def _variant(name, index):
+        """Descrição da variante `index` do efeito e o gerador usado no seu ruído"""
+        effect = SOUND_EFFECTS[name]
+        # Gerador próprio de cada variante: os mesmos sons a cada execução
+        rng = np.random.default_rng((zlib.crc32(name.encode("utf-8")), index))
+        if index > 0:
+            jitter = {"pitch": SOUND_PITCH_JITTER, "volume": SOUND_VOLUME_JITTER,
+                      "envelope": SOUND_ENVELOPE_JITTER}
+            jitter.update(effect.get("jitter", {}))
+            effect = vary(effect, rng, **jitter)
+        return effect, rng
     
-    def _create_hit_sound(self):
-        """Cria som de hit sintético"""
-        duration = 0.2
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        arr = []
-        for i in range(frames):
-            time = float(i) / sample_rate
-            frequency = 200
-            noise = random.uniform(-0.3, 0.3)
-            envelope = (1 - time / duration) ** 3
-            value = int(4096 * (math.sin(frequency * 2 * math.pi * time) + noise) * envelope)
-            arr.append([value, value])
-        
-        sound_array = np.array(arr, dtype=np.int16)
-        sound = pygame.sndarray.make_sound(sound_array)
-        sound.set_volume(self.sfx_volume * 0.5)
-        self.sounds['hit'] = sound
+    def pick(self, sound_name):
+        """Variante a tocar: sorteio O(1) que nunca repete a anterior"""
+        bank = self.sounds.get(sound_name)
+        if not bank:
+            return None
+        if len(bank) == 1:
+            return bank[0]
+        last = self._last_pick.get(sound_name)
+        if last is None:
+            index = self._pick_rng.randrange(len(bank))
+        else:
+            # Sorteia entre as demais e pula a anterior
+            index = self._pick_rng.randrange(len(bank) - 1)
+            if index >= last:
+                index += 1
+        self._last_pick[sound_name] = index
+        return bank[index]
     
     def play_sound(self, sound_name):
-        """Toca um efeito sonoro"""
-        if sound_name in self.sounds:
+        """Pede um efeito sonoro; ele toca no fim do tick, em flush()"""
+        self.voices.request(sound_name)
+    
+    def flush(self):
+        """Toca os pedidos do tick: cada efeito uma vez, mais alto se pedido várias vezes"""
+        for name, count in self.voices.drain():
+            sound = self.pick(name)
+            if sound is None:
+                continue
+            volume = min(1.0, self.sfx_volume * SOUND_EFFECTS[name]["volume"] * coalesced_gain(count))
             try:
-                self.sounds[sound_name].play()
+                self.voices.play(name, sound, volume)
             except pygame.error:
                 pass  # Ignora erros de áudio
     
     def set_sfx_volume(self, volume):
-        """Define o volume dos efeitos sonoros"""
+        """Define o volume dos efeitos sonoros (vale para as próximas vozes)"""
         self.sfx_volume = max(0, min(1, volume))
-        for sound in self.sounds.values():
-            sound.set_volume(self.sfx_volume)
     
     def set_music_volume(self, volume):
         """Define o volume da música"""
@@ -0,0 +1,91 @@
+"""
+Grade de hash espacial para a broadphase de colisões
+"""
+
+
+class SpatialHash:
+    """Grade uniforme que agrupa entidades por célula para consultas de vizinhança"""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = {}  # id(entidade) -> (célula, entrada)
+        self.max_radius = 0
+        self._next_index = 0
+
+    @staticmethod
+    def cell_size_for(*groups, minimum=16):
+        """Calcula o tamanho da célula a partir do maior raio das entidades"""
+        max_radius = 0
+        for group in groups:
+            for entity in group:
+                radius = entity.get_bounding_radius()
+                if radius > max_radius:
+                    max_radius = radius
+        # Com lado = diâmetro máximo, cada círculo ocupa no máximo 2x2 células
+        return max(minimum, max_radius * 2)
+
+    def clear(self):
+        """Remove todas as entidades da grade"""
+        self.cells.clear()
+        self.entries.clear()
+        self.max_radius = 0
+        self._next_index = 0
+
+    def rebuild(self, tagged_groups):
+        """Reconstrói a grade a partir de pares (tag, lista de entidades)"""
+        self.clear()
+        self.cell_size = self.cell_size_for(*(group for _, group in tagged_groups))
+        for tag, group in tagged_groups:
+            for entity in group:
+                self.insert(entity, tag)
+
+    def _cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, entity, tag=None):
+        """Insere uma entidade na célula do seu centro"""
+        cell = self._cell(entity.pos.x, entity.pos.y)
+        # A ordem de inserção é preservada para manter a prioridade das listas do jogo
+        entry = (self._next_index, entity, tag)
+        self._next_index += 1
+        self.cells.setdefault(cell, []).append(entry)
+        self.entries[id(entity)] = (cell, entry)
+        radius = entity.get_bounding_radius()
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def remove(self, entity):
+        """Remove uma entidade da grade (atualização incremental)"""
+        info = self.entries.pop(id(entity), None)
+        if info is None:
+            return
+        cell, entry = info
+        bucket = self.cells[cell]
+        bucket.remove(entry)
+        if not bucket:
+            del self.cells[cell]
+
+    def query(self, x, y, radius, tag=None):
+        """Retorna as entidades vivas cujo círculo pode tocar o círculo informado"""
+        reach = radius + self.max_radius
+        min_x, min_y = self._cell(x - reach, y - reach)
+        max_x, max_y = self._cell(x + reach, y + reach)
+
+        found = []
+        cells = self.cells
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+
+        if len(found) > 1:
+            found.sort(key=lambda entry: entry[0])
+        return [entity for _, entity, entity_tag in found
+                if entity.alive and (tag is None or entity_tag == tag)]
+
+    def query_entity(self, entity, tag=None):
+        """Retorna os vizinhos candidatos de uma entidade"""
+        return [other for other in self.query(entity.pos.x, entity.pos.y, entity.radius, tag)
+                if other is not entity]
@@ -0,0 +1,95 @@
+"""
+Síntese de efeitos sonoros com NumPy: efeitos declarados como dados
+"""
+import numpy as np
+
+# Formas de onda periódicas, em função da fase em ciclos
+WAVES = {
+    "sine": lambda cycles: np.sin(2 * np.pi * cycles),
+    "square": lambda cycles: np.where(cycles % 1.0 < 0.5, 1.0, -1.0),
+    "triangle": lambda cycles: 4 * np.abs(cycles % 1.0 - 0.5) - 1,
+}
+
+
+def time_axis(duration, sample_rate):
+    """Instantes (segundos) de cada amostra"""
+    return np.arange(int(duration * sample_rate)) / sample_rate
+
+
+def sample_bytes(effect, sample_rate):
+    """Memória ocupada pelas amostras do efeito (estéreo int16), sem sintetizá-lo"""
+    return int(effect["duration"] * sample_rate) * 2 * np.dtype(np.int16).itemsize
+
+
+def chirp(t, frequency, sweep=0.0, wave="sine"):
+    """Onda com frequência instantânea `frequency + sweep * t` (sweep em Hz/s)"""
+    cycles = frequency * t + 0.5 * sweep * t * t
+    return WAVES[wave](cycles)
+
+
+def noise(t, rng):
+    """Ruído branco uniforme em [-1, 1)"""
+    return rng.uniform(-1.0, 1.0, len(t))
+
+
+def envelope(t, duration, attack=0.0, decay=0.0):
+    """Subida linear em `attack` segundos e queda (1 - t/duração) ** decay
+
+    decay 0 mantém o volume até o fim; 1 é uma rampa linear, valores
+    maiores encurtam a cauda.
+    """
+    gain = (1.0 - t / duration) ** decay
+    if attack > 0:
+        gain = gain * np.minimum(1.0, t / attack)
+    return gain
+
+
+def synthesize(effect, sample_rate, rng):
+    """Amostras estéreo int16 do efeito descrito por `effect`
+
+    `effect` é um dicionário: duration (s), amplitude (pico em int16),
+    layers (lista de camadas somadas) e envelope opcional (attack, decay).
+    Cada camada tem wave ("sine", "square", "triangle" ou "noise"), level
+    e, para as periódicas, frequency e sweep.
+    """
+    duration = effect["duration"]
+    t = time_axis(duration, sample_rate)
+    signal = np.zeros_like(t)
+    for layer in effect["layers"]:
+        if layer["wave"] == "noise":
+            wave = noise(t, rng)
+        else:
+            wave = chirp(t, layer["frequency"], layer.get("sweep", 0.0), layer["wave"])
+        signal += layer.get("level", 1.0) * wave
+    signal *= envelope(t, duration, **effect.get("envelope", {}))
+
+    samples = np.clip(signal * effect["amplitude"], -32768, 32767).astype(np.int16)
+    # Mixer estéreo: o mesmo sinal nos dois canais
+    return np.column_stack((samples, samples))
+
+
+def vary(effect, rng, pitch=0.0, volume=0.0, envelope=0.0):
+    """Cópia do efeito com altura, volume e envelope sorteados
+
+    Cada jitter é a variação relativa máxima (0.1 = ±10%): pitch multiplica
+    frequências e sweeps, volume a amplitude e envelope a duração e o decay.
+    O ruído também muda, pois vem do `rng` usado na síntese da variante.
+    """
+    def spread(amount):
+        return 1.0 + rng.uniform(-amount, amount)
+
+    ratio = spread(pitch)
+    variant = dict(effect)
+    variant["amplitude"] = effect["amplitude"] * spread(volume)
+    variant["layers"] = [dict(layer, frequency=layer["frequency"] * ratio, sweep=layer.get("sweep", 0.0) * ratio)
+                         if layer["wave"] != "noise" else layer
+                         for layer in effect["layers"]]
+    stretch = spread(envelope)
+    variant["duration"] = effect["duration"] * stretch
+    shape = dict(effect.get("envelope", {}))
+    if shape.get("decay"):
+        shape["decay"] = shape["decay"] * spread(envelope)
+    if shape.get("attack"):
+        shape["attack"] = shape["attack"] * stretch
+    variant["envelope"] = shape
+    return variant
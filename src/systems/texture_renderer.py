@@ -0,0 +1,125 @@
+"""
+Backend de renderização com texturas (pygame._sdl2.video.Renderer)
+"""
+import weakref
+import pygame
+from pygame._sdl2 import video
+from .render_queue import RenderQueue
+
+
+class TextureRenderer:
+    """Compõe o quadro com cópias de texturas no SDL_Renderer
+
+    Os sprites em cache (naves, brilhos, asteroides, estrelas, HUD) viram
+    texturas na primeira vez que são desenhados e ficam associados à
+    superfície de origem enquanto ela existir. Rotação, alpha e escala do
+    quadro passam a ser operações do renderer. O que ainda é desenhado com
+    pygame.draw vai para camadas transparentes (overlays) reenviadas a cada
+    quadro, e telas inteiras em software são enviadas com present_surface().
+
+    `driver` escolhe o driver do SDL pelo nome ("software", "opengl", ...);
+    None deixa o SDL escolher o acelerado disponível. `window_size` separa o
+    tamanho da janela da resolução lógica `size`: o quadro é composto em
+    `size` e o renderer o amplia para a janela.
+    """
+
+    def __init__(self, size, title, driver=None, window_size=None):
+        self.size = size
+        self.window = video.Window(title, window_size or size)
+        index = -1
+        if driver:
+            names = [info.name for info in video.get_drivers()]
+            if driver not in names:
+                raise ValueError(f"Driver de renderização desconhecido: {driver} (disponíveis: {', '.join(names)})")
+            index = names.index(driver)
+        self.renderer = video.Renderer(self.window, index=index)
+        # Resolução lógica fixa: o renderer escala para o tamanho da janela
+        self.renderer.logical_size = size
+        self._textures = weakref.WeakKeyDictionary()
+        self._stale = set()
+        self._overlays = {}
+        self._frame_texture = None
+
+    def texture(self, surface):
+        """Textura da superfície, criada uma vez (overlays são reenviados quando mudam)"""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._textures[surface] = video.Texture.from_surface(self.renderer, surface)
+            self._stale.discard(surface)
+        elif surface in self._stale:
+            texture.update(surface)
+            self._stale.discard(surface)
+        return texture
+
+    def overlay(self, name):
+        """Camada transparente do tamanho da tela, limpa para o quadro atual"""
+        surface = self._overlays.get(name)
+        if surface is None:
+            surface = self._overlays[name] = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        self._stale.add(surface)
+        return surface
+
+    def begin_frame(self):
+        """Limpa o alvo do renderer"""
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+    def present(self):
+        """Mostra o quadro composto"""
+        self.renderer.present()
+
+    def present_surface(self, surface):
+        """Envia uma tela desenhada em software inteira e a mostra"""
+        if self._frame_texture is None:
+            self._frame_texture = video.Texture(self.renderer, self.size, streaming=True)
+        self._frame_texture.update(surface)
+        self.renderer.clear()
+        self._frame_texture.draw()
+        self.renderer.present()
+
+    def __len__(self):
+        return len(self._textures)
+
+
+class TextureRenderQueue(RenderQueue):
+    """Fila de renderização cujo flush copia texturas em vez de fazer blits"""
+
+    rotates = True
+
+    def __init__(self, backend, bounds):
+        super().__init__(bounds)
+        self.backend = backend
+
+    def submit_rotated(self, sprite, x, y, angle, layer=0):
+        """Enfileira o sprite centrado em (x, y), girado `angle` graus (horário)"""
+        width, height = sprite.get_size()
+        left = int(x) - width // 2
+        top = int(y) - height // 2
+        bounds = self.bounds
+        if (left + width <= bounds.left or left >= bounds.right or
+                top + height <= bounds.top or top >= bounds.bottom):
+            self.culled += 1
+            return
+        commands = self._layers.get(layer)
+        if commands is None:
+            commands = self._layers[layer] = []
+        commands.append((sprite, (left, top), angle))
+        self.submitted += 1
+
+    def flush(self, surface=None, max_layer=None, offset=(0, 0)):
+        """Copia as camadas até `max_layer` para o renderer, deslocadas por `offset`"""
+        texture_for = self.backend.texture
+        offset_x, offset_y = offset
+        for layer in sorted(self._layers):
+            if max_layer is not None and layer > max_layer:
+                break
+            for command in self._layers.pop(layer):
+                sprite = command[0]
+                x, y = command[1]
+                texture = texture_for(sprite)
+                if len(command) == 3:
+                    width, height = sprite.get_size()
+                    texture.draw(dstrect=(x + offset_x, y + offset_y, width, height), angle=command[2])
+                else:
+                    texture.draw(dstrect=(x + offset_x, y + offset_y))
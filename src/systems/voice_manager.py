@@ -0,0 +1,104 @@
+"""
+Gerenciador de vozes: canais reservados por categoria, limites e prioridades
+"""
+import math
+import pygame
+from ..core.constants import SOUND_COALESCE_GAIN, SOUND_COALESCE_MAX_GAIN, SOUND_FREE_CHANNELS
+
+
+def coalesced_gain(count):
+    """Ganho de `count` pedidos iguais tocados como uma voz só"""
+    return min(SOUND_COALESCE_MAX_GAIN, 1.0 + SOUND_COALESCE_GAIN * math.log2(count))
+
+
+class VoiceManager:
+    """Distribui os efeitos pelos canais do mixer
+
+    Cada categoria recebe canais próprios, fora do alcance de Sound.play()
+    (pygame.mixer.set_reserved), para que uma rajada de explosões não cale
+    os avisos ao jogador. Os pedidos de um tick ficam pendentes até drain():
+    pedidos repetidos do mesmo efeito viram um único, com a contagem para o
+    ganho, e saem em ordem de prioridade. Ao tocar, um efeito no limite de
+    vozes reinicia a sua voz mais antiga; com a categoria cheia, rouba a voz
+    de menor prioridade (a mais antiga no empate) ou é descartado se todas
+    forem mais importantes.
+    """
+
+    def __init__(self, categories, free_channels=SOUND_FREE_CHANNELS):
+        # categories: nome -> número de canais reservados; outros
+        # `free_channels` canais ficam para quem toca sons sem passar por aqui
+        total = sum(categories.values())
+        if pygame.mixer.get_num_channels() < total + free_channels:
+            pygame.mixer.set_num_channels(total + free_channels)
+        pygame.mixer.set_reserved(total)
+
+        self._channels = {}
+        first = 0
+        for category, count in categories.items():
+            self._channels[category] = [pygame.mixer.Channel(index) for index in range(first, first + count)]
+            first += count
+
+        self._effects = {}
+        self._pending = {}
+        # Canal -> (efeito, prioridade, sequência de início) da voz atual
+        self._voices = {}
+        self._sequence = 0
+        # Estatísticas acumuladas
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def register(self, name, category, priority=0, max_voices=None):
+        """Declara a categoria, a prioridade e o limite de vozes simultâneas do efeito"""
+        channels = self._channels[category]
+        self._effects[name] = (channels, priority, max_voices or len(channels))
+
+    def request(self, name):
+        """Pede o efeito para o fim do tick atual"""
+        if name in self._effects:
+            self._pending[name] = self._pending.get(name, 0) + 1
+
+    def drain(self):
+        """Pedidos do tick como (efeito, vezes pedido), do mais para o menos prioritário"""
+        if not self._pending:
+            return []
+        requests = sorted(self._pending.items(), key=lambda item: -self._effects[item[0]][1])
+        self._pending.clear()
+        for _, count in requests:
+            self.coalesced += count - 1
+        return requests
+
+    def play(self, name, sound, volume):
+        """Toca o som do efeito num canal da sua categoria; devolve o canal ou None"""
+        channels, priority, max_voices = self._effects[name]
+        voices = self._voices
+
+        channel = None
+        same = [candidate for candidate in channels
+                if candidate.get_busy() and voices.get(candidate, (None,))[0] == name]
+        if len(same) >= max_voices:
+            channel = min(same, key=lambda candidate: voices[candidate][2])
+        else:
+            for candidate in channels:
+                if not candidate.get_busy():
+                    channel = candidate
+                    break
+        if channel is None:
+            channel = min(channels, key=lambda candidate: voices.get(candidate, (None, 0, 0))[1:])
+            if voices.get(channel, (None, 0))[1] > priority:
+                self.dropped += 1
+                return None
+            self.stolen += 1
+
+        self._sequence += 1
+        voices[channel] = (name, priority, self._sequence)
+        channel.play(sound)
+        channel.set_volume(volume)
+        self.played += 1
+        return channel
+
+    def active(self, name=None):
+        """Número de vozes tocando (do efeito `name`, ou de todos)"""
+        return sum(1 for channel, voice in self._voices.items()
+                   if channel.get_busy() and (name is None or voice[0] == name))
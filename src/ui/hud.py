@@ -1,8 +1,10 @@
 """
 Sistema de interface de usuário
 """
+import math
 import pygame
 from ..core.constants import *
+from .text_cache import TEXT_CACHE
 
 
 class HUD:
@@ -12,36 +14,74 @@ class HUD:
         self.font_large = font_large
         self.font_medium = font_medium
         self.font_small = font_small
-    
-    def draw_game_hud(self, screen, player, score, high_score, wave):
-        """Desenha a interface durante o jogo"""
-        # Pontuação
-        score_text = self.font_medium.render(f"Pontuação: {score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-        
-        # High Score
-        high_score_text = self.font_small.render(f"Máxima: {high_score}", True, YELLOW)
-        screen.blit(high_score_text, (10, 50))
+        self.text_cache = TEXT_CACHE
         
-        # Wave
-        wave_text = self.font_small.render(f"Onda: {wave}", True, CYAN)
-        screen.blit(wave_text, (10, 80))
-        
-        # Vida
-        for i in range(player.health):
-            heart_x = SCREEN_WIDTH - 40 - (i * 30)
-            pygame.draw.circle(screen, RED, (heart_x, 30), 10)
+        # Composições do HUD, refeitas só quando os valores exibidos mudam
+        self._panel = None
+        self._panel_lines = None
+        self._hearts = None
+        self._hearts_count = None
+    
+    def _hud_lines(self, player, score, high_score, wave):
+        """Linhas de texto do HUD: (fonte, texto, cor, posição)"""
+        lines = [
+            # Pontuação
+            (self.font_medium, f"Pontuação: {score}", WHITE, (10, 10)),
+            # High Score
+            (self.font_small, f"Máxima: {high_score}", YELLOW, (10, 50)),
+            # Wave
+            (self.font_small, f"Onda: {wave}", CYAN, (10, 80)),
+        ]
         
         # Power-ups ativos
         y_offset = 120
         if player.triple_shot_timer > 0:
-            triple_text = self.font_small.render(f"Tiro Triplo: {player.triple_shot_timer:.1f}s", True, CYAN)
-            screen.blit(triple_text, (10, y_offset))
+            # Timer quantizado: o texto muda só a cada HUD_TIMER_STEP segundos
+            timer = math.ceil(player.triple_shot_timer / HUD_TIMER_STEP) * HUD_TIMER_STEP
+            lines.append((self.font_small, f"Tiro Triplo: {timer:.1f}s", CYAN, (10, y_offset)))
             y_offset += 30
         
         if player.shield_active:
-            shield_text = self.font_small.render("Escudo Ativo", True, BLUE)
-            screen.blit(shield_text, (10, y_offset))
+            lines.append((self.font_small, "Escudo Ativo", BLUE, (10, y_offset)))
+        return tuple(lines)
+    
+    def _compose_panel(self, lines):
+        """Monta os textos do HUD em uma única superfície"""
+        surfaces = [(self.text_cache.render(font, text, color), pos) for font, text, color, pos in lines]
+        width = max(pos[0] + surface.get_width() for surface, pos in surfaces)
+        height = max(pos[1] + surface.get_height() for surface, pos in surfaces)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        for surface, pos in surfaces:
+            panel.blit(surface, pos)
+        return panel
+    
+    def _compose_hearts(self, count):
+        """Monta a fileira de corações de vida"""
+        hearts = pygame.Surface((max(1, count) * 30, 21), pygame.SRCALPHA)
+        for i in range(count):
+            pygame.draw.circle(hearts, RED, (hearts.get_width() - 20 - i * 30, 10), 10)
+        return hearts
+    
+    def draw_game_hud(self, screen, player, score, high_score, wave):
+        """Desenha a interface durante o jogo; retorna os retângulos desenhados"""
+        return [screen.blit(sprite, pos) for sprite, pos in self.game_hud_sprites(player, score, high_score, wave)]
+    
+    def game_hud_sprites(self, player, score, high_score, wave):
+        """Superfícies da interface do jogo e suas posições"""
+        lines = self._hud_lines(player, score, high_score, wave)
+        if lines != self._panel_lines:
+            self._panel = self._compose_panel(lines)
+            self._panel_lines = lines
+        
+        # Vida
+        if player.health != self._hearts_count:
+            self._hearts = self._compose_hearts(max(0, player.health))
+            self._hearts_count = player.health
+        
+        sprites = [(self._panel, (0, 0))]
+        if player.health > 0:
+            sprites.append((self._hearts, (SCREEN_WIDTH - 20 - self._hearts.get_width(), 20)))
+        return sprites
     
     def draw_menu_title(self, screen):
         """Desenha o título do menu"""
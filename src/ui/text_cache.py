@@ -0,0 +1,45 @@
+"""
+Cache de textos renderizados com descarte LRU
+"""
+from collections import OrderedDict
+from ..core.constants import TEXT_CACHE_MAX_ENTRIES
+
+
+class TextCache:
+    """Superfícies de texto por (fonte, texto, cor), renderizadas uma única vez
+
+    Textos que mudam (pontuação, timers) geram entradas novas; as menos
+    usadas recentemente são descartadas quando o cache passa de max_entries.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Equivalente a font.render(text, True, color), com cache"""
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, True, color)
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def clear(self):
+        """Descarta todos os textos"""
+        self._surfaces.clear()
+
+
+# Cache compartilhado pelo HUD e pelas telas estáticas
+TEXT_CACHE = TextCache()
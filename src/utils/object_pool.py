@@ -0,0 +1,44 @@
+"""
+Pool de objetos reutilizáveis com free-list
+"""
+
+
+class ObjectPool:
+    """Pool de capacidade fixa: reaproveita objetos liberados via reset()
+
+    Os objetos precisam implementar reset(*args) com a mesma assinatura do
+    construtor. Quando a free-list está vazia um objeto novo é criado; ao
+    liberar, objetos além da capacidade são descartados para o GC.
+    """
+
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """Retorna um objeto reinicializado com os argumentos informados"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.factory(*args)
+            self.created += 1
+        obj.pooled = False
+        return obj
+
+    def release(self, obj):
+        """Devolve um objeto ao pool (liberações repetidas são ignoradas)"""
+        if getattr(obj, "pooled", True):
+            return
+        obj.pooled = True
+        if len(self.free) < self.capacity:
+            self.free.append(obj)
+
+    def release_all(self, objects):
+        """Devolve uma coleção de objetos ao pool"""
+        for obj in objects:
+            self.release(obj)
@@ -11,6 +11,11 @@ class Vector2:
         self.x = x
         self.y = y
     
+    def update(self, x, y):
+        """Altera as componentes no lugar, sem criar um vetor novo"""
+        self.x = x
+        self.y = y
+    
     def __add__(self, other):
         return Vector2(self.x + other.x, self.y + other.y)
     
@@ -4,13 +4,119 @@ StellarClash - Jogo de Tiro Espacial
 Arquivo principal de inicialização do jogo
 """
 
-from src.core.game_engine import GameEngine
+import argparse
 
+from src.core.config import asset_cache_dir, load_config
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TICK_RATE, RENDERER_SOFTWARE, RENDERER_TEXTURE
 
-def main():
+
+def parse_args(argv=None):
+    """Lê as opções de linha de comando"""
+    parser = argparse.ArgumentParser(description="StellarClash - Jogo de Tiro Espacial")
+    parser.add_argument("--headless", action="store_true",
+                        help="simula sem janela, sem áudio e sem limite de quadros")
+    parser.add_argument("--ticks", type=int,
+                        help="número de ticks a simular no modo headless")
+    parser.add_argument("--duration", type=float,
+                        help="segundos de jogo a simular no modo headless")
+    parser.add_argument("--sessions", type=int,
+                        help="encerra após N partidas concluídas no modo headless")
+    parser.add_argument("--autofire", action="store_true",
+                        help="dispara sempre que possível no modo headless")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE,
+                        help=f"ticks de simulação por segundo (padrão: {TICK_RATE})")
+    parser.add_argument("--profile", action="store_true",
+                        help="exibe o overlay do profiler de quadros (alternável com F3)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="atualiza só as regiões alteradas da tela (fundo estático durante o jogo)")
+    parser.add_argument("--renderer", choices=(RENDERER_SOFTWARE, RENDERER_TEXTURE),
+                        help="backend de renderização (padrão: [DISPLAY] renderer do config.ini)")
+    parser.add_argument("--no-asset-cache", action="store_true",
+                        help="gera sprites e sons na memória, sem ler nem gravar o cache em disco")
+    parser.add_argument("--seed", type=int,
+                        help="semente base das partidas (reprodutível)")
+    parser.add_argument("--record", metavar="ARQUIVO",
+                        help="grava as entradas da última partida em ARQUIVO")
+    parser.add_argument("--replay", metavar="ARQUIVO",
+                        help="reproduz uma partida gravada com --record")
+    return parser.parse_args(argv)
+
+
+def load_replay(args):
+    """Carrega a gravação indicada em --replay, se houver"""
+    if args.replay is None:
+        return None
+    from src.systems.input_state import InputRecording
+    return InputRecording.load(args.replay)
+
+
+def run_headless(args):
+    """Executa uma simulação headless e imprime o resumo"""
+    import pygame
+    from src.core.game_engine import GameEngine
+
+    ticks = args.ticks
+    if args.duration is not None:
+        duration_ticks = int(args.duration * args.tick_rate)
+        ticks = duration_ticks if ticks is None else min(ticks, duration_ticks)
+    if ticks is None and args.sessions is None and args.replay is None:
+        ticks = args.tick_rate * 60  # Um minuto de jogo por padrão
+
+    game = GameEngine(tick_rate=args.tick_rate, headless=True, seed=args.seed,
+                      record_path=args.record, replay=load_replay(args))
+    summary = game.run_headless(ticks=ticks, sessions=args.sessions, autofire=args.autofire)
+    game.save_recording()
+    pygame.quit()
+
+    print(f"Ticks simulados: {summary['ticks']} ({summary['sim_time']:.1f}s de jogo)")
+    print(f"Tempo real: {summary['wall_time']:.2f}s ({summary['speedup']:.1f}x tempo real)")
+    print(f"Partidas concluídas: {summary['sessions']}")
+    if summary["scores"]:
+        print(f"Pontuações: {summary['scores']}")
+    print(f"Pontuação da partida atual: {summary['current_score']}")
+
+
+def renderer_options(args):
+    """Backend, driver e tamanho da janela: linha de comando, depois config.ini"""
+    config = load_config()
+    renderer = args.renderer or config.get("DISPLAY", "renderer", fallback="").strip() or RENDERER_SOFTWARE
+    render_driver = config.get("DISPLAY", "render_driver", fallback="").strip() or None
+    window_size = None
+    if renderer == RENDERER_TEXTURE:
+        # Só o renderer amplia o quadro; no backend software a janela tem a resolução lógica
+        window_size = (config.getint("DISPLAY", "screen_width", fallback=SCREEN_WIDTH),
+                       config.getint("DISPLAY", "screen_height", fallback=SCREEN_HEIGHT))
+    return renderer, render_driver, window_size
+
+
+def configure_asset_cache(args):
+    """Liga o cache de assets em disco conforme a linha de comando e o config.ini"""
+    from src.systems.asset_cache import ASSET_CACHE
+    config = load_config()
+    enabled = not args.no_asset_cache and config.getboolean("ASSETS", "cache", fallback=True)
+    ASSET_CACHE.configure(directory=asset_cache_dir(config), enabled=enabled)
+
+
+def main(argv=None):
     """Função principal do jogo"""
+    args = parse_args(argv)
+    configure_asset_cache(args)
+
+    if args.headless:
+        # Sem console interativo: erros devem encerrar o processo com falha
+        run_headless(args)
+        return
+
     try:
-        game = GameEngine()
+        from src.core.game_engine import GameEngine
+        from src.core.game_states import GameState
+        renderer, render_driver, window_size = renderer_options(args)
+        game = GameEngine(tick_rate=args.tick_rate, seed=args.seed,
+                          record_path=args.record, replay=load_replay(args),
+                          profile=args.profile, dirty_rects=args.dirty_rects,
+                          renderer=renderer, render_driver=render_driver, window_size=window_size)
+        if game.replay is not None:
+            game.change_state(GameState.PLAYING)
         game.run()
     except Exception as e:
         print(f"Erro ao executar o jogo: {e}")
@@ -0,0 +1,10 @@
+"""
+Configuração comum dos testes: SDL sem janela nem áudio e projeto no sys.path
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,42 @@
+"""
+Quadro congelado da pausa: igual nos backends de software e de texturas
+"""
+import numpy as np
+import pygame
+
+from src.core.constants import RENDERER_SOFTWARE, RENDERER_TEXTURE
+from src.core.game_engine import GameEngine
+from src.core.game_states import GameState
+from src.entities.asteroid import Asteroid
+from src.systems.asset_cache import ASSET_CACHE
+from src.systems.random_service import RandomService
+
+
+def frozen_frame(renderer, monkeypatch):
+    """Joga alguns ticks com a mesma semente, pausa e devolve o quadro congelado"""
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: 1000)
+    render_driver = "software" if renderer == RENDERER_TEXTURE else None
+    # O campo de estrelas é sorteado antes da semente da partida
+    RandomService().reseed(3)
+    game = GameEngine(headless=True, seed=3, renderer=renderer, render_driver=render_driver)
+    try:
+        game.change_state(GameState.PLAYING)
+        for x, y in ((250, 200), (700, 300), (500, 550)):
+            game.asteroids.append(Asteroid(x, y, 3))
+        for _ in range(30):
+            game.step(shoot=True)
+            game.player.health = 3
+        game.change_state(GameState.PAUSED)
+        assert game.asteroids and game.bullets
+        return pygame.surfarray.array3d(game.states[GameState.PAUSED].frozen_frame)
+    finally:
+        pygame.quit()
+
+
+def test_frozen_frame_matches_across_backends(monkeypatch):
+    ASSET_CACHE.configure(enabled=False)
+    software = frozen_frame(RENDERER_SOFTWARE, monkeypatch)
+    texture = frozen_frame(RENDERER_TEXTURE, monkeypatch)
+
+    # A pausa é desenhada em superfícies nos dois backends: o quadro deve ser o mesmo
+    assert np.array_equal(software, texture)